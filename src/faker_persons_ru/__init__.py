@@ -1,2 +1,5 @@
 # faker_persons_ru
 NAME = 'faker_persons_ru'
+# Records generated at once by datasets and generators, and the least
+# amount of values computed with numpy.
+BATCH_SIZE: int = 10_000
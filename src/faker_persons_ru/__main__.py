@@ -8,35 +8,70 @@ Main module for:
 MySQL/MariaDB) in user's home directory.
 """
 import click
-import pandas as pd
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from faker_persons_ru.modules import datasets
 from faker_persons_ru.modules import outputs
-from faker_persons_ru.data.locations import LOCALITIES
+from faker_persons_ru.modules import phone
 from faker_persons_ru import __version__
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 PATH_TO_OUTPUT: Path = Path.home()
-PERSONS: tuple[str, str, str, str, str] = (
-    'Фамилия',
-    'Имя',
-    'Отчество',
-    'Пол',
-    'Дата рождения',
-)
-CONTACTS: tuple[str, str] = ('Телефон', 'E-mail')
-LOCATIONS: tuple[str, str] = ('Регион', 'Населённый пункт')
+PERSONS: tuple[str, str, str, str, str] = datasets.PERSONS
+CONTACTS: tuple[str, str] = datasets.CONTACTS
+LOCATIONS: tuple[str, str] = datasets.LOCATIONS
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     '-t',
     '--total',
-    type=click.IntRange(1, 100_000, clamp=True),
+    type=click.IntRange(min=1),
     default=1_000,
     help=(
-        'Number of generating fake personal data (default 1000). '
+        'Number of generating fake personal data (default 1000, up to '
+        + 'about 55 million: dates of birth must suffice for the most '
+        + 'frequent names). '
+        + 'Only one value is accepted!'
+    ),
+)
+@click.option(
+    '-c',
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=datasets.CHUNK_SIZE,
+    help=(
+        'Number of records generated and written at once '
+        + f'(default {datasets.CHUNK_SIZE}), bounds memory for large '
+        + 'datasets. '
+        + 'Only one value is accepted!'
+    ),
+)
+@click.option(
+    '-w',
+    '--workers',
+    type=click.IntRange(1, datasets.WINDOW_SIZE),
+    default=1,
+    help=(
+        'Number of processes generating the dataset '
+        + f'(default 1, up to {datasets.WINDOW_SIZE}), '
+        + 'records stay unique and ordered for any number of processes. '
+        + 'Only one value is accepted!'
+    ),
+)
+@click.option(
+    '-s',
+    '--seed',
+    type=int,
+    default=None,
+    help=(
+        'Seed of the dataset (random by default): the same seed, total and '
+        + 'data give the same dataset for any chunk size and number of '
+        + 'processes. '
         + 'Only one value is accepted!'
     ),
 )
@@ -67,6 +102,17 @@ LOCATIONS: tuple[str, str] = ('Регион', 'Населённый пункт')
         + 'Multiply values are accepted!'
     ),
 )
+@click.option(
+    '-p',
+    '--phone-format',
+    type=click.Choice(['default', 'e164', 'digits'], case_sensitive=False),
+    default='default',
+    help=(
+        'Format of phone numbers: "default" as +7(XXX)XXX-XX-XX, '
+        + '"e164" as +7XXXXXXXXXX or "digits" as 7XXXXXXXXXX. '
+        + 'Only one value is accepted!'
+    ),
+)
 @click.option(
     '-o',
     '--output',
@@ -79,30 +125,79 @@ LOCATIONS: tuple[str, str] = ('Регион', 'Населённый пункт')
         + 'Only one value is accepted!'
     ),
 )
-def cli(total: int, filetype: tuple[str, ...], data: str, output: str) -> None:
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    total: int,
+    chunk_size: int,
+    workers: int,
+    seed: Optional[int],
+    filetype: tuple[str, ...],
+    data: str,
+    phone_format: str,
+    output: str,
+) -> None:
     """
     faker_persons_ru (using Click and pandas) generates datasets of fake Russian
     personal data (full name, sex, phone number, email address, region and
     locality) and store them into different formats.
+
+    Run "serve --help" for a local HTTP service streaming datasets.
     """
+    if ctx.invoked_subcommand is not None:
+        return
+
     click.secho(
         f'Generating new dataset "{output}", waiting a few seconds...\n',
         fg='green',
     )
 
-    df = gen_data(total, data)
-    click.echo(df)
+    if 'xlsx' in filetype and total > outputs.EXCEL_MAX_ROWS:
+        raise click.BadParameter(
+            f'MS Excel files hold up to {outputs.EXCEL_MAX_ROWS} records.',
+            param_hint="'--total'",
+        )
+    if data in ('contact', 'full') and total > phone.CAPACITY:
+        raise click.BadParameter(
+            f'Only {phone.CAPACITY} unique phone numbers are available.',
+            param_hint="'--total'",
+        )
+
+    half = outputs.MIN_ROWS // 2
+    head: Optional[dict[str, Any]] = None
+    tail: Optional[dict[str, Any]] = None
+    writers: list[outputs.Writer] = []
+    error: Optional[BaseException] = None
+
+    try:
+        for extension in filetype:
+            writers.append(
+                outputs.open_writer(
+                    extension, output, PATH_TO_OUTPUT, phone_format
+                )
+            )
 
-    if 'csv' in filetype:
-        outputs.to_csv(df, output, PATH_TO_OUTPUT)
-    if 'xlsx' in filetype:
-        outputs.to_excel(df, output, PATH_TO_OUTPUT)
-    if 'sqlite3' in filetype:
-        outputs.to_sqlite3(df, output, PATH_TO_OUTPUT)
-    if 'sql' in filetype:
-        outputs.to_sql(df, output, PATH_TO_OUTPUT)
-    if 'mysql' in filetype:
-        outputs.to_mysql(df, output, PATH_TO_OUTPUT)
+        for columns in datasets.iter_persons(
+            total, data, chunk_size, workers, seed
+        ):
+            for writer in writers:
+                writer.send(columns)
+
+            head = outputs.add_rows(head, columns, outputs.MAX_ROWS)
+            tail = outputs.add_rows(tail, columns, -half)
+    except datasets.UniquenessError as exc:
+        error = exc
+        raise click.BadParameter(str(exc), param_hint="'--total'") from None
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        outputs.close_writers(writers, error)
+
+    if head is not None and tail is not None:
+        if total > outputs.MAX_ROWS:
+            head = {name: head[name][:half] + tail[name] for name in head}
+        click.echo(outputs.to_screen(head, phone_format, total))
 
     click.echo()
 
@@ -121,54 +216,86 @@ def cli(total: int, filetype: tuple[str, ...], data: str, output: str) -> None:
     )
 
 
-def gen_data(total: int, data: str) -> pd.DataFrame:
-    """Create pandas DataFrame frome generated dataset(s).
+@cli.command()
+@click.option(
+    '--host',
+    default='127.0.0.1',
+    help='Host to listen on (default 127.0.0.1).',
+)
+@click.option(
+    '--port',
+    type=click.IntRange(min=0, max=65535),
+    default=8000,
+    help='Port to listen on (default 8000).',
+)
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(),
+    default=None,
+    help='Path of a Unix socket to listen on instead of the host and port.',
+)
+@click.option(
+    '--threads',
+    type=click.IntRange(min=1),
+    default=4,
+    help='Number of threads generating datasets (default 4).',
+)
+def serve(
+    host: str, port: int, socket_path: Optional[str], threads: int
+) -> None:
+    """
+    Serve datasets over HTTP: GET /persons?total=&data=&seed=&format= streams
+    records as NDJSON (format=ndjson, default) or CSV (format=csv).
+    """
+    from faker_persons_ru.modules import server
+
+    address = socket_path or f'http://{host}:{port}'
+    click.secho(
+        f'Serving datasets on {address}, press Ctrl+C to stop.', fg='green'
+    )
+    server.serve(host, port, socket_path, threads)
+
+
+def gen_columns(
+    total: int, data: str, seed: Optional[int] = None
+) -> dict[str, list[Any]]:
+    """Create columns of generated dataset(s) without pandas.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
         data: A type (str) of generated data - personal info/
         personal info and contacts/personal info and localities/full info.
+        seed: A seed (int) of the dataset (random if not passed); the CLI
+        writes the same dataset for the same seed.
 
     Returns:
-        A pandas DataFrame containing fake Russian personal data and--if they
-        were chosen--contacts info and locations.
+        A dict mapping names of columns (str) to lists of fake Russian personal
+        data and--if they were chosen--contacts info and locations; dates of
+        birth are days since 1970-01-01 (int) and phones are 10-digit
+        integers, names are shared with vocabularies.
     """
-    base_dset = datasets.gen_base(total)
-    indeces: pd.RangeIndex = pd.RangeIndex(start=1, stop=total + 1, name='ID')
-    base_df = pd.DataFrame(base_dset, columns=PERSONS, index=indeces)
-
-    if data == 'contact':
-        contact_dset = datasets.gen_contact(total, base_dset)
-        contact_df = pd.DataFrame(
-            contact_dset, columns=CONTACTS, index=indeces
-        )
-        base_plus_contact_df = base_df.join(contact_df)
+    columns = next(datasets.iter_persons(total, data, total, seed=seed))
 
-        return base_plus_contact_df
-    elif data == 'location':
-        location_dset = datasets.gen_location(total, LOCALITIES)
-        location_df = pd.DataFrame(
-            location_dset, columns=LOCATIONS, index=indeces
-        )
-        base_plus_location_df = base_df.join(location_df)
+    return columns
 
-        return base_plus_location_df
-    elif data == 'full':
-        contact_dset = datasets.gen_contact(total, base_dset)
-        contact_df = pd.DataFrame(
-            contact_dset, columns=CONTACTS, index=indeces
-        )
 
-        location_dset = datasets.gen_location(total, LOCALITIES)
-        location_df = pd.DataFrame(
-            location_dset, columns=LOCATIONS, index=indeces
-        )
+def gen_data(
+    total: int, data: str, seed: Optional[int] = None
+) -> 'pd.DataFrame':
+    """Create pandas DataFrame frome generated dataset(s).
 
-        full_df = base_df.join([contact_df, location_df])
+    Args:
+        total: A total amount (int) of records/fake persons; from user input.
+        data: A type (str) of generated data - personal info/
+        personal info and contacts/personal info and localities/full info.
+        seed: A seed (int) of the dataset (random if not passed).
 
-        return full_df
-    else:
-        return base_df
+    Returns:
+        A pandas DataFrame containing fake Russian personal data and--if they
+        were chosen--contacts info and locations.
+    """
+    return datasets.to_frame(gen_columns(total, data, seed))
 
 
 if __name__ == '__main__':
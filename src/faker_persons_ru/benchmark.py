@@ -0,0 +1,136 @@
+"""
+Module for benchmarking peak memory of DataFrames of generated datasets.
+
+Building one DataFrame from columns (datasets.to_frame(), used by
+__main__.gen_data()) is compared with the former assembly of gen_data(): three
+DataFrames (persons, contacts and locations) of rows of strings (object
+columns) joined by their index; rendering dates of birth and phones as strings
+counts for the former way, as the former generators returned strings. Memory
+is traced by tracemalloc (numpy and pandas report their buffers to it).
+
+Run `python -m faker_persons_ru.benchmark [TOTAL]` (default 100000 records of
+"full" data); times include the overhead of tracing.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from faker_persons_ru.modules import datasets
+from faker_persons_ru.modules import outputs
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_TOTAL: int = 100_000
+SEED: int = 0
+HEADER: str = '{:<24}{:>10}{:>11}{:>9}'
+ROW: str = '{:<24}{:>10.1f}{:>11.1f}{:>9.2f}'
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, float, float, float]:
+    """Measure peak and retained memory of a call.
+
+    Args:
+        build: A function (callable without arguments) to measure.
+
+    Returns:
+        A tuple of the result of the call, its peak and retained memory
+        (float, MB; allocations made by the call) and its time (float, s).
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    result = build()
+
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, peak / 1e6, retained / 1e6, elapsed
+
+
+def to_rows(columns: dict[str, list[Any]]) -> list[list[tuple[str, ...]]]:
+    """Convert columns to rows of strings as the former generators gave.
+
+    Args:
+        columns: A dict mapping names of columns to lists of values (see
+        datasets.to_columns()) of "full" data.
+
+    Returns:
+        Three lists of rows (tuples of str) of persons, contacts and
+        locations; dates of birth as YYYY-MM-DD and phones in the default
+        format (see outputs.format_data()).
+    """
+    values = outputs.format_data(columns, 'default')
+
+    return [
+        list(zip(*(values[column] for column in names)))
+        for names in (datasets.PERSONS, datasets.CONTACTS, datasets.LOCATIONS)
+    ]
+
+
+def join_frames(row_lsts: list[list[tuple[str, ...]]]) -> 'pd.DataFrame':
+    """Build a DataFrame as three DataFrames joined by their index.
+
+    Args:
+        row_lsts: Rows of persons, contacts and locations (see to_rows()).
+
+    Returns:
+        A pandas DataFrame of persons joined with DataFrames of contacts and
+        locations, all columns of strings (the former assembly of
+        gen_data()).
+    """
+    import pandas as pd
+
+    ids = pd.RangeIndex(start=1, stop=len(row_lsts[0]) + 1, name='ID')
+    base_df, contact_df, location_df = (
+        pd.DataFrame(rows, columns=list(names), index=ids)
+        for rows, names in zip(
+            row_lsts,
+            (datasets.PERSONS, datasets.CONTACTS, datasets.LOCATIONS),
+        )
+    )
+
+    return base_df.join([contact_df, location_df])
+
+
+def run_benchmark(total: int = DEFAULT_TOTAL) -> None:
+    """Print peak memory of both ways to build a DataFrame.
+
+    Args:
+        total: A total amount (int) of records of "full" data.
+    """
+    import pandas as pd
+
+    columns, peak, retained, elapsed = measure(
+        lambda: next(datasets.iter_persons(total, 'full', total, seed=SEED))
+    )
+    print(f'{total} records of "full" data, seed {SEED}')
+    print(HEADER.format('', 'peak, MB', 'frame, MB', 'time, s'))
+    print(ROW.format('generation (columns)', peak, retained, elapsed))
+
+    frames: list[pd.DataFrame] = []
+
+    for name, build in (
+        ('three frames + join', lambda: join_frames(to_rows(columns))),
+        ('one frame', lambda: datasets.to_frame(columns)),
+    ):
+        frame, peak, retained, elapsed = measure(build)
+        frames.append(frame)
+        print(ROW.format(name, peak, retained, elapsed))
+        del frame
+
+    joined = frames[0]
+    rendered = outputs.format_data(frames[1], 'default')
+
+    for column in joined.columns:
+        if joined[column].tolist() != list(map(str, rendered[column])):
+            raise AssertionError(f'Frames differ in column "{column}".')
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TOTAL)
@@ -1,4 +1,6 @@
 # faker_persons_ru
+from importlib import import_module
+
 __all__ = [
     'reader',
     'last_names_male',
@@ -10,4 +12,17 @@ __all__ = [
     'patronymics_m',
     'patronymics_s',
     'locations',
+    'pack',
+    'vocabularies',
 ]
+
+
+def __getattr__(name: str):
+    """Get dictionaries of names and localities lazily (e.g. LOCALITIES)."""
+    if name.isupper():
+        pack = import_module('faker_persons_ru.data.pack')
+
+        if name in pack.MODULES:
+            return pack.get_dict(name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,350 @@
+"""
+Module for packing reference data (names, localities and their weights) into
+a binary file and reading tables from it.
+
+The pack holds string tables (UTF-8 strings separated by newlines) and arrays
+of codes (uint16) and weights (float64); it is memory-mapped on demand, so
+only the tables in use are decoded, arrays of weights are read from mapped
+pages without copying, and forked processes share these pages. Without the
+pack tables are read from modules with dictionaries.
+
+Run `python -m faker_persons_ru.data.pack` to rebuild the pack after
+changing the dictionaries.
+"""
+import json
+import mmap
+import struct
+import sys
+
+from array import array
+from functools import cache
+from importlib import import_module
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Sequence
+
+PACK_PATH: Path = Path(__file__).with_name('tables.pack')
+MAGIC: bytes = b'FPRUPACK'
+HEADER: struct.Struct = struct.Struct('<8sI')
+MODULES: dict[str, str] = {
+    'LAST_NAMES_MALE': 'last_names_male',
+    'LAST_NAMES_FEMALE': 'last_names_female',
+    'FIRST_NAMES_MALE_J': 'first_names_j',
+    'FIRST_NAMES_FEMALE_J': 'first_names_j',
+    'FIRST_NAMES_MALE_M': 'first_names_m',
+    'FIRST_NAMES_FEMALE_M': 'first_names_m',
+    'FIRST_NAMES_MALE_S': 'first_names_s',
+    'FIRST_NAMES_FEMALE_S': 'first_names_s',
+    'PATRONYMICS_MALE_J': 'patronymics_j',
+    'PATRONYMICS_FEMALE_J': 'patronymics_j',
+    'PATRONYMICS_MALE_M': 'patronymics_m',
+    'PATRONYMICS_FEMALE_M': 'patronymics_m',
+    'PATRONYMICS_MALE_S': 'patronymics_s',
+    'PATRONYMICS_FEMALE_S': 'patronymics_s',
+    'LOCALITIES': 'locations',
+}
+VOCABULARIES: dict[str, tuple[str, ...]] = {
+    'LAST_NAMES': ('LAST_NAMES_MALE', 'LAST_NAMES_FEMALE'),
+    'FIRST_NAMES': (
+        'FIRST_NAMES_MALE_J',
+        'FIRST_NAMES_FEMALE_J',
+        'FIRST_NAMES_MALE_M',
+        'FIRST_NAMES_FEMALE_M',
+        'FIRST_NAMES_MALE_S',
+        'FIRST_NAMES_FEMALE_S',
+    ),
+    'PATRONYMICS': (
+        'PATRONYMICS_MALE_J',
+        'PATRONYMICS_FEMALE_J',
+        'PATRONYMICS_MALE_M',
+        'PATRONYMICS_FEMALE_M',
+        'PATRONYMICS_MALE_S',
+        'PATRONYMICS_FEMALE_S',
+    ),
+}
+
+
+class Table(NamedTuple):
+    """A table of names or localities with their weights."""
+
+    names: Sequence[str]
+    weights: Sequence[float]
+    regions: Optional[Sequence[str]] = None
+
+
+def gen_vocabulary(*tables: dict[str, Any]) -> tuple[str, ...]:
+    """Create a vocabulary of names from tables of names.
+
+    Args:
+        tables: Russian names (dicts) mapping names (keys, str) and their
+        weights (values, float).
+
+    Returns:
+        A tuple (of str) of all names from the tables, sorted and without
+        duplicates; positions of names are their codes in datasets.
+    """
+    vocabulary = tuple(sorted({name for table in tables for name in table}))
+
+    return vocabulary
+
+
+@cache
+def get_dict(name: str) -> dict[str, Any]:
+    """Get a dictionary of names or localities (loaded on first use).
+
+    Args:
+        name: A name (str) of the dictionary, e.g. 'LAST_NAMES_MALE'.
+
+    Returns:
+        A dict mapping names (keys, str) and their weights (values, float)
+        or localities (keys, str) and their regions and weights (values,
+        tuple); rebuilt from the pack if it exists.
+    """
+    if load_pack() is None:
+        module = import_module(f'faker_persons_ru.data.{MODULES[name]}')
+        return getattr(module, name)
+
+    table = get_table(name)
+
+    if table.regions is None:
+        return dict(zip(table.names, table.weights))
+
+    return {
+        locality: (region, weight)
+        for locality, region, weight in zip(
+            table.names, table.regions, table.weights
+        )
+    }
+
+
+@cache
+def get_table(name: str) -> Table:
+    """Get a table of names or localities (loaded on first use).
+
+    Args:
+        name: A name (str) of the table, e.g. 'LAST_NAMES_MALE'.
+
+    Returns:
+        An object of namedtuple 'Table' containing names (or localities),
+        their weights and--for localities--regions.
+    """
+    pack = load_pack()
+
+    if pack is None:
+        names_dict = get_dict(name)
+        values = list(names_dict.values())
+
+        if name == 'LOCALITIES':
+            return Table(
+                list(names_dict),
+                [value[1] for value in values],
+                [value[0] for value in values],
+            )
+
+        return Table(list(names_dict), values)
+
+    view, header = pack
+    entry = header['tables'][name]
+    weights = read_array(view, 'd', entry['weights'], entry['size'])
+
+    if name == 'LOCALITIES':
+        region_codes = read_array(view, 'H', entry['codes'], entry['size'])
+        regions = read_strings(view, header['strings']['REGIONS'])
+
+        return Table(
+            read_strings(view, header['strings']['LOCALITIES']),
+            weights,
+            [regions[code] for code in region_codes],
+        )
+
+    vocabulary = get_vocabulary(entry['vocabulary'])
+    codes = read_array(view, 'H', entry['codes'], entry['size'])
+
+    return Table([vocabulary[code] for code in codes], weights)
+
+
+@cache
+def get_vocabulary(name: str) -> tuple[str, ...]:
+    """Get a vocabulary of names (loaded on first use).
+
+    Args:
+        name: A name (str) of the vocabulary from VOCABULARIES.
+
+    Returns:
+        A tuple (of str) of all names for a column of datasets.
+    """
+    pack = load_pack()
+
+    if pack is None:
+        names_dicts = [get_dict(table) for table in VOCABULARIES[name]]
+        return gen_vocabulary(*names_dicts)
+
+    view, header = pack
+
+    return tuple(read_strings(view, header['strings'][name]))
+
+
+@cache
+def load_pack(
+    path: Path = PACK_PATH,
+) -> Optional[tuple[memoryview, dict[str, Any]]]:
+    """Map the pack into memory.
+
+    Args:
+        path: A path (PosixPath) to the pack.
+
+    Returns:
+        A tuple of a memoryview of the mapped blocks and the header (dict with
+        offsets of string tables and arrays in the blocks) or None if there
+        is no pack.
+    """
+    if not path.is_file():
+        return None
+
+    with open(path, 'rb') as infile:
+        mapped = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    magic, header_size = HEADER.unpack_from(view)
+
+    if magic != MAGIC:
+        raise ValueError(f'File "{path}" is not a pack of faker_persons_ru.')
+
+    header_end = HEADER.size + header_size
+    header = json.loads(bytes(view[HEADER.size : header_end]))
+
+    return view[header_end:], header
+
+
+def read_strings(view: memoryview, block: list[int]) -> list[str]:
+    """Decode a string table of the pack.
+
+    Args:
+        view: A memoryview of the mapped pack.
+        block: An offset and a size (list of int) of the string table.
+
+    Returns:
+        A list (of str) of strings from the table.
+    """
+    offset, size = block
+
+    return str(view[offset : offset + size], 'utf-8').split('\n')
+
+
+def read_array(
+    view: memoryview, typecode: str, offset: int, size: int
+) -> Sequence[Any]:
+    """Read an array of codes or weights from the pack.
+
+    Args:
+        view: A memoryview of the mapped pack.
+        typecode: A type code (str) of items: 'H' (uint16) or 'd' (float64).
+        offset: An offset (int) of the array.
+        size: An amount (int) of items.
+
+    Returns:
+        A memoryview of the mapped array (no copy) or--on big-endian
+        machines--an array with swapped bytes.
+    """
+    itemsize = array(typecode).itemsize
+    items = view[offset : offset + size * itemsize]
+
+    if sys.byteorder == 'little':
+        return items.cast(typecode)
+
+    swapped = array(typecode, items.tobytes())
+    swapped.byteswap()
+
+    return swapped
+
+
+def build_pack(path: Path = PACK_PATH) -> None:
+    """Generate the pack from modules with dictionaries.
+
+    Args:
+        path: A path (PosixPath) to the pack.
+
+    Raises:
+        ValueError: Names can not be told apart in logins of emails (see
+        email.check_names()).
+
+    Notes:
+        The file starts with MAGIC, the size of the header and the header
+        (JSON), followed by blocks of string tables and arrays; arrays are
+        little-endian and aligned to 8 bytes.
+    """
+    from faker_persons_ru.modules import email
+
+    dicts = {
+        name: getattr(import_module(f'faker_persons_ru.data.{module}'), name)
+        for name, module in MODULES.items()
+    }
+    strings: dict[str, list[str]] = {
+        name: list(gen_vocabulary(*(dicts[table] for table in tables)))
+        for name, tables in VOCABULARIES.items()
+    }
+    email.check_names(strings['LAST_NAMES'], strings['FIRST_NAMES'])
+
+    localities = dicts['LOCALITIES']
+    strings['LOCALITIES'] = list(localities)
+    strings['REGIONS'] = sorted({value[0] for value in localities.values()})
+
+    blocks: list[bytes] = []
+    header: dict[str, Any] = {'strings': {}, 'tables': {}}
+    position = 0
+
+    def add_block(block: bytes) -> int:
+        nonlocal position
+        offset = position
+        padding = -len(block) % 8
+        blocks.append(block + b'\0' * padding)
+        position += len(block) + padding
+        return offset
+
+    def to_bytes(typecode: str, items: list[Any]) -> bytes:
+        items_arr = array(typecode, items)
+        if sys.byteorder == 'big':
+            items_arr.byteswap()
+        return items_arr.tobytes()
+
+    for name, string_lst in strings.items():
+        block = '\n'.join(string_lst).encode('utf-8')
+        header['strings'][name] = [add_block(block), len(block)]
+
+    for name, names_dict in dicts.items():
+        values = list(names_dict.values())
+        entry: dict[str, Any] = {'size': len(names_dict)}
+
+        if name == 'LOCALITIES':
+            regions = {
+                region: code for code, region in enumerate(strings['REGIONS'])
+            }
+            codes = [regions[value[0]] for value in values]
+            weights = [value[1] for value in values]
+        else:
+            entry['vocabulary'] = next(
+                vocabulary
+                for vocabulary, tables in VOCABULARIES.items()
+                if name in tables
+            )
+            vocabulary = {
+                string: code
+                for code, string in enumerate(strings[entry['vocabulary']])
+            }
+            codes = [vocabulary[string] for string in names_dict]
+            weights = values
+
+        entry['codes'] = add_block(to_bytes('H', codes))
+        entry['weights'] = add_block(to_bytes('d', weights))
+        header['tables'][name] = entry
+
+    header_bytes = json.dumps(header).encode('utf-8')
+    header_bytes += b' ' * (-(HEADER.size + len(header_bytes)) % 8)
+
+    with open(path, 'wb') as outfile:
+        outfile.write(HEADER.pack(MAGIC, len(header_bytes)))
+        outfile.write(header_bytes)
+        outfile.writelines(blocks)
+
+
+if __name__ == '__main__':
+    build_pack()
@@ -1,50 +1,265 @@
 """Module for create data lists based on their weights."""
 import random
 
+from functools import cache
+from typing import Any, Optional, Sequence, Union
 
-def read_name(total: int, names_dict: dict[str, float]) -> list[str]:
+from faker_persons_ru.data import pack
+from faker_persons_ru.data.pack import Table
+
+
+class AliasSampler:
+    """A sampler of items based on their weights (Vose's alias method).
+
+    Tables of probabilities and aliases are built once, then every item is
+    drawn in O(1) with a single random number: its integer part selects a
+    column of the table, its fractional part selects the item of the column
+    or its alias.
+    """
+
+    def __init__(self, items: list[Any], weights: list[float]) -> None:
+        """Build tables of probabilities and aliases.
+
+        Args:
+            items: Items (list) to draw.
+            weights: Weights (list of float) of the items.
+        """
+        size = len(items)
+        weight_sum = sum(weights)
+        scaled = [weight * size / weight_sum for weight in weights]
+
+        probs = [1.0] * size
+        aliases = list(range(size))
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probs[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] += scaled[less] - 1.0
+
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self.size = size
+        self.items = items
+        self.probs = probs
+        self.aliases = [items[alias] for alias in aliases]
+
+    def sample(
+        self, k: int, rng: Optional[random.Random] = None
+    ) -> list[Any]:
+        """Draw items based on their weights.
+
+        Args:
+            k: An amount (int) of items to draw.
+            rng: A stream of random numbers (the global one if not passed).
+
+        Returns:
+            A list of k items drawn with replacement.
+        """
+        size = self.size
+        items = self.items
+        probs = self.probs
+        aliases = self.aliases
+        rand = (rng or random).random
+        sample_lst: list[Any] = []
+
+        for point in [rand() * size for _ in range(k)]:
+            i = int(point)
+            sample_lst.append(
+                items[i] if point - i < probs[i] else aliases[i]
+            )
+
+        return sample_lst
+
+    def pick(self, fraction: float) -> Any:
+        """Draw an item for a given random number.
+
+        Args:
+            fraction: A random number (float) from [0, 1).
+
+        Returns:
+            An item drawn as if by sample() with this number.
+        """
+        point = fraction * self.size
+        i = min(int(point), self.size - 1)
+
+        return self.items[i] if point - i < self.probs[i] else self.aliases[i]
+
+
+@cache
+def get_sampler(name: str, coded: bool = False) -> AliasSampler:
+    """Get a sampler for a table of names or localities (built once).
+
+    Args:
+        name: A name (str) of the table, e.g. 'LAST_NAMES_MALE' or
+        'LOCALITIES' (see pack.get_table()).
+        coded: Whether the sampler draws codes of names (positions in the
+        vocabulary of the table, see pack.VOCABULARIES) instead of names.
+
+    Returns:
+        An object of class 'AliasSampler' drawing names, their codes or
+        tuples of region and locality; cached by the name of the table.
+    """
+    vocabulary = None
+
+    if coded:
+        vocabulary = next(
+            pack.get_vocabulary(vocabulary_name)
+            for vocabulary_name, tables in pack.VOCABULARIES.items()
+            if name in tables
+        )
+
+    return build_sampler(pack.get_table(name), vocabulary)
+
+
+def build_sampler(
+    table: Union[dict[str, Any], Table],
+    vocabulary: Optional[Sequence[str]] = None,
+) -> AliasSampler:
+    """Build a sampler for a table of names or localities.
+
+    Args:
+        table: Russian names (dict) mapping names (keys, str) and their
+        weights (values, float), Russian locations (dict) mapping populated
+        localities (keys, str) and their regions and weights (values, tuple)
+        or an object of namedtuple 'Table' with the same data.
+        vocabulary: A vocabulary (sequence of str) of names; if passed,
+        the sampler draws codes (positions in the vocabulary) of names.
+
+    Returns:
+        An object of class 'AliasSampler' drawing names, their codes or
+        tuples of region and locality; not cached (see get_sampler()).
+    """
+    names, weights, regions = to_table(table)
+
+    if vocabulary is not None:
+        codes = {name: code for code, name in enumerate(vocabulary)}
+        items = [codes[name] for name in names]
+    elif regions is not None:
+        items = list(zip(regions, names))
+    else:
+        items = list(names)
+
+    return AliasSampler(items, list(weights))
+
+
+def to_table(table: Union[dict[str, Any], Table]) -> Table:
+    """Convert a dictionary of names or localities to a table.
+
+    Args:
+        table: Russian names or locations (dict) or an object of namedtuple
+        'Table'.
+
+    Returns:
+        An object of namedtuple 'Table' containing names (or localities),
+        their weights and--for localities--regions.
+    """
+    if isinstance(table, Table):
+        return table
+
+    values = list(table.values())
+
+    if values and isinstance(values[0], tuple):
+        return Table(
+            list(table),
+            [value[1] for value in values],
+            [value[0] for value in values],
+        )
+
+    return Table(list(table), values)
+
+
+def read_name(
+    total: int,
+    names_dict: Union[dict[str, float], Table, str],
+    rng: Optional[random.Random] = None,
+) -> list[str]:
     """Create lists of Russian first names, last names and patronymics.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
         names_dict: Russian names (key, str) and their weights (value, float)
-        as dict.
+        as dict, an object of namedtuple 'Table' or a name (str) of a table
+        of the pack (its sampler is cached, see get_sampler()).
+        rng: A stream of random numbers (the global one if not passed).
 
     Returns:
         A list (of str) representing names; based on weights (i.e. frequency of
         use) for a certain amount of persons.
     """
-    names_from_dict = list(names_dict.keys())
-    weights_from_dict = list(names_dict.values())
+    if isinstance(names_dict, str):
+        sampler = get_sampler(names_dict)
+    else:
+        sampler = build_sampler(names_dict)
 
-    name_lst = random.choices(
-        names_from_dict, weights=weights_from_dict, k=total
-    )
+    name_lst = sampler.sample(total, rng)
 
     return name_lst
 
 
+def read_code(
+    total: int,
+    names_dict: Union[dict[str, float], Table, str],
+    vocabulary: Sequence[str],
+    rng: Optional[random.Random] = None,
+) -> list[int]:
+    """Create lists of codes of Russian first names, last names and patronymics.
+
+    Args:
+        total: A total amount (int) of records/fake persons; from user input.
+        names_dict: Russian names (key, str) and their weights (value, float)
+        as dict, an object of namedtuple 'Table' or a name (str) of a table
+        of the pack (its sampler is cached, see get_sampler()).
+        vocabulary: A vocabulary (sequence of str) containing all names of
+        names_dict; for a name of a table, the vocabulary of the table (see
+        pack.VOCABULARIES).
+        rng: A stream of random numbers (the global one if not passed).
+
+    Returns:
+        A list (of int) representing names as their positions in the
+        vocabulary; based on weights (i.e. frequency of use) for a certain
+        amount of persons.
+    """
+    if isinstance(names_dict, str):
+        sampler = get_sampler(names_dict, coded=True)
+    else:
+        sampler = build_sampler(names_dict, vocabulary)
+
+    code_lst = sampler.sample(total, rng)
+
+    return code_lst
+
+
 def read_location(
-    total: int, localities_dict: dict[str, tuple[str, float]]
+    total: int,
+    localities_dict: Union[dict[str, tuple[str, float]], Table, str],
+    rng: Optional[random.Random] = None,
 ) -> list[tuple[str, str]]:
     """Create lists of Russian piopulated localities with regions.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
         localities_dict: Russian locations (dict) mapping populated localities
-        (keys, str) and their regions and weights (values, tuple of str).
+        (keys, str) and their regions and weights (values, tuple of str), an
+        object of namedtuple 'Table' or the name (str) of the table of the
+        pack, 'LOCALITIES' (its sampler is cached, see get_sampler()).
+        rng: A stream of random numbers (the global one if not passed).
 
     Returns:
         A list (tuple of strings) representing localities and regions; based
         on weights (according to population) for a certain amount of persons.
     """
-    localities_from_dict = list(localities_dict.keys())
-    regions_from_dict = [value[0] for value in localities_dict.values()]
-    weights_from_dict = [value[1] for value in localities_dict.values()]
-    locations_lst = list(zip(regions_from_dict, localities_from_dict))
-
-    locality_lst = random.choices(
-        locations_lst, weights=weights_from_dict, k=total
-    )
+    if isinstance(localities_dict, str):
+        sampler = get_sampler(localities_dict)
+    else:
+        sampler = build_sampler(localities_dict)
+
+    locality_lst = sampler.sample(total, rng)
 
     return locality_lst
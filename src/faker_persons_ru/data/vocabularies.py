@@ -0,0 +1,6 @@
+"""Vocabularies of Russian names for integer-coded datasets."""
+from faker_persons_ru.data import pack
+
+LAST_NAMES: tuple[str, ...] = pack.get_vocabulary('LAST_NAMES')
+FIRST_NAMES: tuple[str, ...] = pack.get_vocabulary('FIRST_NAMES')
+PATRONYMICS: tuple[str, ...] = pack.get_vocabulary('PATRONYMICS')
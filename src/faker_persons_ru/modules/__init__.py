@@ -1,9 +1,14 @@
 # faker_persons_ru
 __all__ = [
     'birthday',
+    'counter',
     'datasets',
     'demography',
     'email',
+    'generator',
     'outputs',
+    'permutation',
     'phone',
+    'seeding',
+    'server',
 ]
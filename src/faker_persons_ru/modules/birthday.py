@@ -2,32 +2,99 @@
 import datetime
 import random
 
+from functools import cache
+from typing import Optional
+
 from faker_persons_ru.modules.demography import Age
 
+EPOCH: int = datetime.date(1970, 1, 1).toordinal()
+
 
-def gen_birthday(age: Age, amount: int) -> list[str]:
+def gen_birthday(
+    age: Age,
+    amount: int,
+    date_table: Optional[range] = None,
+    rng: Optional[random.Random] = None,
+) -> list[int]:
     """Generate random birthdays for a certain age.
 
     Args:
         age: An object of dataclass 'Age' for a certain age.
         amount: An amount (int) of male/female persons of a certain age.
+        date_table: Dates (range of int) to draw from, e.g. dates of a shard
+        (see gen_date_table()); all dates of the age if not passed.
+        rng: A stream of random numbers (the global one if not passed).
 
     Returns:
-        A list (of str) containing dates of birth from datetime (YYYY-MM-DD) for
+        A list (of int) containing dates of birth as days since 1970-01-01 for
         fake Russian people of a certain age.
     """
-    date_start = datetime.datetime(age.year_start, 1, 1)
-    date_end = datetime.datetime(age.year_end, 12, 31)
-    date_delta = datetime.timedelta(days=1)
+    if date_table is None:
+        date_table = gen_date_table(age)
 
-    date_lst: list[str] = []
-    birthday_lst: list[str] = []
-    date = date_start
+    birthday_lst = (rng or random).choices(date_table, k=amount)
 
-    while date <= date_end:
-        date_lst.append(date.strftime('%Y-%m-%d'))
-        date += date_delta
+    return birthday_lst
 
-    birthday_lst = random.choices(date_lst, k=amount)
 
-    return birthday_lst
+@cache
+def gen_date_table(age: Age, shard: int = 0, shards: int = 1) -> range:
+    """Generate all dates of birth for a certain age (once per age).
+
+    Args:
+        age: An object of dataclass 'Age' for a certain age.
+        shard: A number (int) of a shard of a dataset.
+        shards: An amount (int) of shards of the dataset.
+
+    Returns:
+        A range (of int) containing every date as days since 1970-01-01
+        between the first and the last years of the age--or every shards-th
+        of them starting from the shard-th one, so shards never share dates;
+        cached by age and shard.
+    """
+    date_start = datetime.date(age.year_start, 1, 1).toordinal() - EPOCH
+    date_end = datetime.date(age.year_end, 12, 31).toordinal() - EPOCH
+
+    date_table = range(date_start, date_end + 1)[shard::shards]
+
+    return date_table
+
+
+def to_year(day: int) -> int:
+    """Get a year of a date without creating a date object.
+
+    Args:
+        day: A date (int) as days since 1970-01-01.
+
+    Returns:
+        A year (int) of the date in the proleptic Gregorian calendar.
+    """
+    days = day + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era
+        - day_of_era // 1460
+        + day_of_era // 36524
+        - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    # Years are counted from March, so January and February (day_of_year
+    # beyond 305) belong to the next calendar year.
+    year = year_of_era + era * 400 + (day_of_year >= 306)
+
+    return year
+
+
+def to_iso(day: int) -> str:
+    """Render a date of birth as a string.
+
+    Args:
+        day: A date (int) as days since 1970-01-01.
+
+    Returns:
+        A str containing a date from datetime (YYYY-MM-DD).
+    """
+    return datetime.date.fromordinal(EPOCH + day).isoformat()
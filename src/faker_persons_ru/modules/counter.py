@@ -0,0 +1,474 @@
+"""
+Module for generating records of a dataset by their indexes (counter-based
+generation).
+
+Every record is a pure function of the seed of a dataset and the index of the
+record, so any record, slice or range of a dataset is computed without
+generating the records before it, and ranges are computed independently (e.g.
+in parallel). Uniqueness holds by construction instead of checking keys:
+- indexes are mapped to age/sex groups by a keyed permutation (exact amounts
+of calc_groups()),
+- names of a group are drawn by stratified sampling over cumulative weights of
+the tables, so persons sharing a name take consecutive positions and get
+different dates of birth by their rank,
+- phones are positions of the index in the permutation of all phones,
+- logins of emails hold full names with a tag of the date of birth and
+patronymic.
+
+Class 'Dataset' wraps such records into a lazy sequence: records are computed
+on access and never stored, slices are views. Records have the same columns and
+types as chunks of datasets.iter_persons(), but they are generated another way:
+datasets of both with the same seed differ.
+"""
+import copy
+import hashlib
+import math
+import struct
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, overload
+
+from faker_persons_ru.modules import birthday
+from faker_persons_ru.modules import datasets
+from faker_persons_ru.modules import email
+from faker_persons_ru.modules import phone
+from faker_persons_ru.modules import seeding
+from faker_persons_ru.modules.demography import Age
+from faker_persons_ru.modules.permutation import Permutation
+from faker_persons_ru.data import reader
+from faker_persons_ru.data.pack import Table
+from faker_persons_ru.data.vocabularies import LAST_NAMES, FIRST_NAMES
+from faker_persons_ru.data.vocabularies import PATRONYMICS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+STRIDE: int = 7919
+LOGIN_PATTERNS: list[str] = email.LOGIN_PATTERNS
+TAG_WIDTH: int = len(str(len(PATRONYMICS) - 1))
+DRAWS: struct.Struct = struct.Struct('<3Q')
+NAME_KEY: struct.Struct = struct.Struct('<4I')
+
+
+class Quantiles:
+    """Cumulative weights of a table of names.
+
+    Every item holds an interval of [0, 1) as long as its weight; items are
+    located by a point of the interval, so evenly spaced points draw items
+    in exact proportions (stratified sampling).
+    """
+
+    def __init__(self, items: list[int], weights: Sequence[float]) -> None:
+        """Build intervals of items.
+
+        Args:
+            items: Items (list of int, e.g. codes of names) of a table.
+            weights: Weights (sequence of float) of the items.
+        """
+        weight_sum = sum(weights)
+
+        self.items = items
+        self.widths = [weight / weight_sum for weight in weights]
+        self.starts = [0.0, *accumulate(self.widths)][:-1]
+
+    def locate(self, point: float) -> tuple[int, float]:
+        """Locate an item by a point of [0, 1).
+
+        Args:
+            point: A point (float) from [0, 1).
+
+        Returns:
+            A tuple of the position (int) of the item holding the point and
+            the relative position (float, from [0, 1)) of the point within
+            the interval of the item.
+        """
+        i = max(bisect_right(self.starts, point) - 1, 0)
+        fraction = (point - self.starts[i]) / self.widths[i]
+
+        return i, min(max(fraction, 0.0), math.nextafter(1.0, 0.0))
+
+
+class RecordSpace:
+    """Records of a seeded dataset computed by their indexes.
+
+    Records have the same columns and types as chunks of
+    datasets.iter_persons() (names shared with vocabularies, dates of birth
+    as days since 1970-01-01, phones as integers), but every record depends
+    only on the total, the type of data, the seed and its index; so records
+    differ from those of datasets.iter_persons() with the same seed.
+    """
+
+    def __init__(
+        self, total: int, data: str = 'base', seed: Optional[int] = None
+    ) -> None:
+        """Prepare keys and tables of a dataset.
+
+        Args:
+            total: A total amount (int) of records/fake persons.
+            data: A type (str) of generated data - "base" (personal info),
+            "contact" (and contacts), "location" (and localities) or "full".
+            seed: A seed (int) of the dataset; a new one is drawn from the
+            global random generator if not passed.
+
+        Raises:
+            UniquenessError: A name is so frequent that its persons of an age
+            would outnumber dates of birth.
+            ValueError: There are not enough phones for contacts.
+        """
+        if total < 1:
+            raise ValueError('The size of a dataset must be positive.')
+
+        is_contact = data in ('contact', 'full')
+        is_location = data in ('location', 'full')
+
+        if is_contact and total > phone.CAPACITY:
+            raise ValueError(
+                f'Unable to generate {total} unique phones, '
+                + f'only {phone.CAPACITY} phone numbers are available.'
+            )
+
+        self.total = total
+        self.data = data
+        self.seed = seeding.gen_seed(seed)
+        self.columns = list(datasets.PERSONS)
+        self.groups = datasets.calc_groups(total)
+        self.starts = list(
+            accumulate((amount for _, _, amount in self.groups), initial=0)
+        )
+        self.positions = Permutation(
+            total, seeding.get_rng(self.seed, 'index').getrandbits(64)
+        )
+        self.offsets = [
+            seeding.get_rng(self.seed, 'offset', i).random()
+            for i in range(len(self.groups))
+        ]
+        self.date_key = seeding.get_key(self.seed, 'dates')
+        self.record_key = seeding.get_key(self.seed, 'records')
+        self.quantiles: dict[int, tuple[Quantiles, Quantiles, Quantiles]] = {}
+        self.phone_space: Optional[Permutation] = None
+        self.localities: Optional[reader.AliasSampler] = None
+
+        for i, (age, sex, amount) in enumerate(self.groups):
+            if amount > 0:
+                quantiles = get_quantiles(*datasets.get_tables(age, sex))
+                check_capacity(age, sex, amount, quantiles)
+                self.quantiles[i] = quantiles
+
+        if is_contact:
+            self.columns += datasets.CONTACTS
+            self.phone_space = Permutation(
+                phone.CAPACITY,
+                seeding.get_rng(self.seed, 'phone').getrandbits(64),
+            )
+        if is_location:
+            self.columns += datasets.LOCATIONS
+            self.localities = reader.get_sampler('LOCALITIES')
+
+    def __len__(self) -> int:
+        return self.total
+
+    def get_row(self, index: int) -> list[Any]:
+        """Compute a record by its index.
+
+        Args:
+            index: A position (int) of the record in range(total).
+
+        Returns:
+            A list of values of the record in the order of columns.
+        """
+        position = self.positions[index]
+        group = bisect_right(self.starts, position) - 1
+        age, sex, amount = self.groups[group]
+        local = position - self.starts[group]
+        offset = self.offsets[group]
+        last_q, first_q, patronymic_q = self.quantiles[group]
+
+        last_idx, fraction = last_q.locate((local + offset) / amount)
+        first_idx, fraction = first_q.locate(fraction)
+        patronymic_idx, _ = patronymic_q.locate(fraction)
+        name_start = last_q.starts[last_idx] + last_q.widths[last_idx] * (
+            first_q.starts[first_idx]
+            + first_q.widths[first_idx] * patronymic_q.starts[patronymic_idx]
+        )
+        # Persons sharing a name hold consecutive local positions, so their
+        # ranks differ and map to different dates of birth.
+        rank = local - math.ceil(name_start * amount - offset)
+
+        last_name = last_q.items[last_idx]
+        first_name = first_q.items[first_idx]
+        patronymic = patronymic_q.items[patronymic_idx]
+        name_hash = hashlib.blake2b(
+            NAME_KEY.pack(group, last_name, first_name, patronymic),
+            digest_size=8,
+            key=self.date_key,
+        ).digest()
+        date_table = birthday.gen_date_table(age)
+        date_of_birth = date_table[
+            (int.from_bytes(name_hash, 'little') + rank * STRIDE)
+            % len(date_table)
+        ]
+
+        row: list[Any] = [
+            LAST_NAMES[last_name],
+            FIRST_NAMES[first_name],
+            PATRONYMICS[patronymic],
+            sex,
+            date_of_birth,
+        ]
+
+        if self.phone_space is None and self.localities is None:
+            return row
+
+        pattern_draw, domain_draw, locality_draw = (
+            (draw >> 11) * 2**-53
+            for draw in DRAWS.unpack(
+                hashlib.blake2b(
+                    index.to_bytes(8, 'little'),
+                    digest_size=DRAWS.size,
+                    key=self.record_key,
+                ).digest()
+            )
+        )
+
+        if self.phone_space is not None:
+            row.append(phone.to_phone(self.phone_space[index]))
+            row.append(
+                gen_email(
+                    row,
+                    patronymic,
+                    LOGIN_PATTERNS[int(pattern_draw * len(LOGIN_PATTERNS))],
+                    email.DOMAINS[int(domain_draw * len(email.DOMAINS))],
+                )
+            )
+        if self.localities is not None:
+            row.extend(self.localities.pick(locality_draw))
+
+        return row
+
+    def get_record(self, index: int) -> dict[str, Any]:
+        """Compute a record by its index.
+
+        Args:
+            index: A position (int) of the record in range(total).
+
+        Returns:
+            A dict mapping names of columns to values of the record.
+        """
+        return dict(zip(self.columns, self.get_row(index)))
+
+    def get_columns(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> dict[str, list[Any]]:
+        """Compute a range of records.
+
+        Args:
+            start: A position (int) of the first record of the range.
+            stop: A position (int) after the last record of the range (the
+            end of the dataset if not passed).
+
+        Returns:
+            A dict mapping names of columns to lists of values of the range,
+            with the same columns and types as chunks of
+            datasets.iter_persons().
+        """
+        rows = [
+            self.get_row(i)
+            for i in range(*slice(start, stop).indices(self.total))
+        ]
+
+        return {
+            column: [row[i] for row in rows]
+            for i, column in enumerate(self.columns)
+        }
+
+
+class Dataset(Sequence):
+    """A lazy dataset of fake Russian persons.
+
+    Behaves like a read-only sequence of records (dicts, see
+    RecordSpace.get_record()): len(), indexing, slicing and iteration.
+    Records are computed on access and never stored, a slice is a view of
+    the same records (a range of indexes), so memory does not depend on the
+    size of the dataset. Views are converted to columns or DataFrames.
+    Records differ from those of datasets.iter_persons() with the same seed
+    (see RecordSpace).
+    """
+
+    def __init__(
+        self, total: int, data: str = 'base', seed: Optional[int] = None
+    ) -> None:
+        """Prepare a dataset.
+
+        Args:
+            total: A total amount (int) of records/fake persons.
+            data: A type (str) of generated data (see RecordSpace).
+            seed: A seed (int) of the dataset; a new one is drawn from the
+            global random generator if not passed.
+        """
+        self.space = RecordSpace(total, data, seed)
+        self.indexes = range(total)
+
+    @property
+    def seed(self) -> int:
+        return self.space.seed
+
+    @property
+    def columns(self) -> list[str]:
+        return self.space.columns
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    @overload
+    def __getitem__(self, key: int) -> dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> 'Dataset':
+        ...
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[dict[str, Any], 'Dataset']:
+        """Get a record or a view of records.
+
+        Args:
+            key: A position (int, negative ones count from the end) or a
+            slice of positions in the dataset.
+
+        Returns:
+            A record (dict) or a 'Dataset' viewing the slice.
+
+        Raises:
+            IndexError: The position is out of the dataset.
+        """
+        if isinstance(key, slice):
+            view = copy.copy(self)
+            view.indexes = self.indexes[key]
+            return view
+
+        if not -len(self.indexes) <= key < len(self.indexes):
+            raise IndexError('Dataset index out of range.')
+
+        return self.space.get_record(self.indexes[key])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in self.indexes:
+            yield self.space.get_record(index)
+
+    def __repr__(self) -> str:
+        indexes = self.indexes
+
+        return (
+            f'Dataset(total={self.space.total}, data={self.space.data!r}, '
+            + f'seed={self.seed})'
+            + f'[{indexes.start}:{indexes.stop}:{indexes.step}]'
+        )
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """Compute records of the dataset (or view) as columns.
+
+        Returns:
+            A dict mapping names of columns to lists of values (see
+            datasets.to_columns()).
+        """
+        rows = [self.space.get_row(index) for index in self.indexes]
+
+        return {
+            column: [row[i] for row in rows]
+            for i, column in enumerate(self.columns)
+        }
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """Compute records of the dataset (or view) as a DataFrame.
+
+        Returns:
+            A pandas DataFrame (see datasets.to_frame()) indexed by IDs of
+            the records in the whole dataset (positions from 1).
+        """
+        return datasets.to_frame(self.to_columns(), self.indexes)
+
+
+def get_quantiles(
+    *tables: Table,
+) -> tuple[Quantiles, Quantiles, Quantiles]:
+    """Build quantiles of last names, first names and patronymics.
+
+    Args:
+        tables: Objects of namedtuple 'Table' with last names, first names and
+        patronymics (see datasets.get_tables()).
+
+    Returns:
+        A tuple of objects of class 'Quantiles' holding codes of names
+        (positions in LAST_NAMES, FIRST_NAMES and PATRONYMICS).
+    """
+    quantiles = []
+
+    for table, vocabulary in zip(
+        tables, (LAST_NAMES, FIRST_NAMES, PATRONYMICS)
+    ):
+        codes = {name: code for code, name in enumerate(vocabulary)}
+        names, weights, _ = reader.to_table(table)
+        quantiles.append(Quantiles([codes[name] for name in names], weights))
+
+    last_q, first_q, patronymic_q = quantiles
+
+    return last_q, first_q, patronymic_q
+
+
+def check_capacity(
+    age: Age,
+    sex: str,
+    amount: int,
+    quantiles: tuple[Quantiles, Quantiles, Quantiles],
+) -> None:
+    """Check that dates of birth suffice for the most frequent name.
+
+    Args:
+        age: An object of dataclass 'Age' for a certain age.
+        sex: A value (str) from SEX.
+        amount: An amount (int) of persons of the age and sex.
+        quantiles: Quantiles (tuple) of names of the age and sex.
+
+    Raises:
+        UniquenessError: Ranks of persons sharing the most frequent name
+        would outnumber dates of birth of the age.
+    """
+    width = math.prod(max(names_q.widths) for names_q in quantiles)
+    capacity = len(birthday.gen_date_table(age))
+
+    if math.ceil(width * amount) + 2 > capacity:
+        raise datasets.UniquenessError(
+            f'Unable to generate {amount} unique persons (age {age.group}, '
+            + f'sex {sex}): only {capacity} dates of birth for a name.'
+        )
+
+
+def gen_email(
+    row: list[Any], patronymic: int, pattern: str, domain: str
+) -> str:
+    """Generate an email address unique by construction.
+
+    Args:
+        row: Values (list) of a record: names, sex and date of birth.
+        patronymic: A code (int) of the patronymic.
+        pattern: A pattern (str) from LOGIN_PATTERNS.
+        domain: A domain (str) from email.DOMAINS.
+
+    Returns:
+        A str containing a fake Russian personal email address.
+
+    Notes:
+        Logins hold full last and first names (their transliterations are
+        distinct and have letters only) followed by a tag of the date of
+        birth (YYMMDD, years of all ages span less than a century) and the
+        code of patronymic; so different persons get different logins.
+    """
+    iso_date = birthday.to_iso(row[4])
+    login_ru = pattern.format(last_name=row[0], first_name=row[1])
+    tag = f'{iso_date[2:4]}{iso_date[5:7]}{iso_date[8:10]}'
+    tag += str(patronymic).zfill(TAG_WIDTH)
+
+    return email.translit_login(login_ru) + tag + domain
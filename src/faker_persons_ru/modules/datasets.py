@@ -1,48 +1,499 @@
 """
 Module for generating datasets (fake Russian persons, contacts and locations).
 """
+import gc
+import logging
+import math
 import random
 
-from collections import deque
-from itertools import product
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import groupby, product
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 
+from faker_persons_ru import BATCH_SIZE
 from faker_persons_ru.modules import demography
 from faker_persons_ru.modules.demography import Age, SEX
 from faker_persons_ru.modules.demography import JUNIOR, MIDDLE, SENIOR
 from faker_persons_ru.modules import birthday
 from faker_persons_ru.modules import email
 from faker_persons_ru.modules import phone
+from faker_persons_ru.modules import seeding
+from faker_persons_ru.modules.seeding import Streams
+from faker_persons_ru.data import pack
 from faker_persons_ru.data import reader
-from faker_persons_ru.data.last_names_male import LAST_NAMES_MALE
-from faker_persons_ru.data.last_names_female import LAST_NAMES_FEMALE
-from faker_persons_ru.data.first_names_j import FIRST_NAMES_MALE_J
-from faker_persons_ru.data.first_names_j import FIRST_NAMES_FEMALE_J
-from faker_persons_ru.data.first_names_m import FIRST_NAMES_MALE_M
-from faker_persons_ru.data.first_names_m import FIRST_NAMES_FEMALE_M
-from faker_persons_ru.data.first_names_s import FIRST_NAMES_MALE_S
-from faker_persons_ru.data.first_names_s import FIRST_NAMES_FEMALE_S
-from faker_persons_ru.data.patronymics_j import PATRONYMICS_MALE_J
-from faker_persons_ru.data.patronymics_j import PATRONYMICS_FEMALE_J
-from faker_persons_ru.data.patronymics_m import PATRONYMICS_MALE_M
-from faker_persons_ru.data.patronymics_m import PATRONYMICS_FEMALE_M
-from faker_persons_ru.data.patronymics_s import PATRONYMICS_MALE_S
-from faker_persons_ru.data.patronymics_s import PATRONYMICS_FEMALE_S
-
-
-def gen_base(total: int) -> list[list[str]]:
-    """Generate a dataset of fake Russian data (name, sex, date of birth).
+from faker_persons_ru.data.pack import Table
+from faker_persons_ru.data.vocabularies import LAST_NAMES, FIRST_NAMES
+from faker_persons_ru.data.vocabularies import PATRONYMICS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PERSONS: tuple[str, str, str, str, str] = (
+    'Фамилия',
+    'Имя',
+    'Отчество',
+    'Пол',
+    'Дата рождения',
+)
+CONTACTS: tuple[str, str] = ('Телефон', 'E-mail')
+LOCATIONS: tuple[str, str] = ('Регион', 'Населённый пункт')
+CHUNK_SIZE: int = 100_000
+SHARD_SIZE: int = 250_000
+QUEUE_SIZE: int = 4
+QUEUE_TIMEOUT: float = 1.0
+WINDOW_SIZE: int = 8
+MAX_REDRAWN: float = 0.01
+FIRST_BITS: int = (len(FIRST_NAMES) - 1).bit_length()
+PATRONYMIC_BITS: int = (len(PATRONYMICS) - 1).bit_length()
+DATE_BITS: int = 32
+DATE_OFFSET: int = 1 << (DATE_BITS - 1)
+FLUSH_SIZE: int = 4096
+
+logger = logging.getLogger(__name__)
+
+
+class UniquenessError(ValueError):
+    """An error raised when unique fake data can not be generated."""
+
+
+class PersonKeys:
+    """A set of persons' keys packed into 64-bit integers.
+
+    A key holds codes of a full name (see pack_name()) in its high bits and
+    a date of birth in its low DATE_BITS bits, so persons sharing a name
+    hold one range of keys. New keys are kept in a set; once FLUSH_SIZE of
+    them are collected, they are moved into sorted numpy arrays (int64, 8
+    bytes per key) merged into runs of growing sizes, and counts of names
+    are taken from these ranges instead of being stored.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty set of keys."""
+        self.pending: set[int] = set()
+        self.pending_names: dict[int, int] = {}
+        self.runs: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.pending) + sum(len(run) for run in self.runs)
+
+    def __contains__(self, key: int) -> bool:
+        if key in self.pending:
+            return True
+
+        for run in self.runs:
+            i = run.searchsorted(key)
+            if i < len(run) and run[i] == key:
+                return True
+
+        return False
+
+    def add(self, key: int) -> None:
+        """Add a key (int) which is not in the set yet."""
+        prefix = key >> DATE_BITS
+        self.pending.add(key)
+        self.pending_names[prefix] = self.pending_names.get(prefix, 0) + 1
+
+    def count(self, prefix: int) -> int:
+        """Count keys of a name.
+
+        Args:
+            prefix: Packed codes (int) of a full name (see pack_name()).
+
+        Returns:
+            An amount (int) of keys with this name.
+        """
+        return self.pending_names.get(prefix, 0) + self.count_runs(prefix)
+
+    def count_runs(self, prefix: int) -> int:
+        """Count keys of a name in sorted runs (pending keys are not counted).
+
+        Args:
+            prefix: Packed codes (int) of a full name (see pack_name()).
+
+        Returns:
+            An amount (int) of keys with this name in the runs.
+        """
+        lower, upper = prefix << DATE_BITS, (prefix + 1) << DATE_BITS
+        name_count = 0
+
+        for run in self.runs:
+            name_count += int(
+                run.searchsorted(upper) - run.searchsorted(lower)
+            )
+
+        return name_count
+
+    def find_one(self, key: int) -> tuple[bool, int]:
+        """Look up a key and count its name in sorted runs at once.
+
+        Args:
+            key: A key (int) to look up.
+
+        Returns:
+            A tuple: whether the key is in the runs (bool) and how many keys
+            of its name the runs hold (int); pending keys are not counted.
+
+        Notes:
+            Every run is searched once for the bounds of the name and the
+            key together, as single records do not come in batches (see
+            find()).
+        """
+        if not self.runs:
+            return False, 0
+
+        import numpy as np
+
+        prefix = key >> DATE_BITS
+        bounds = np.array(
+            (prefix << DATE_BITS, key, (prefix + 1) << DATE_BITS),
+            dtype=np.int64,
+        )
+        is_found = False
+        name_count = 0
+
+        for run in self.runs:
+            lower, position, upper = run.searchsorted(bounds).tolist()
+            is_found = is_found or (position < upper and run[position] == key)
+            name_count += upper - lower
+
+        return is_found, name_count
+
+    def find(
+        self, keys: list[int], prefixes: list[int]
+    ) -> Optional[tuple[list[bool], list[int]]]:
+        """Look up keys and count their names in sorted runs at once.
+
+        Args:
+            keys: Keys (list of int) to look up.
+            prefixes: Packed codes (list of int) of names of the keys.
+
+        Returns:
+            A tuple of lists: whether each key is in the runs (bool) and how
+            many keys of its name the runs hold (int); None if there are no
+            runs yet (all keys are pending). Pending keys are not counted.
+        """
+        if not self.runs:
+            return None
+
+        import numpy as np
+
+        key_arr = np.array(keys, dtype=np.int64)
+        lower_arr = np.array(prefixes, dtype=np.int64) << DATE_BITS
+        upper_arr = lower_arr + (1 << DATE_BITS)
+        found_arr = np.zeros(len(keys), dtype=bool)
+        count_arr = np.zeros(len(keys), dtype=np.int64)
+
+        for run in self.runs:
+            positions = run.searchsorted(key_arr)
+            found_arr |= run[np.minimum(positions, len(run) - 1)] == key_arr
+            count_arr += run.searchsorted(upper_arr) - run.searchsorted(
+                lower_arr
+            )
+
+        return found_arr.tolist(), count_arr.tolist()
+
+    def flush(self, size: int = 0) -> None:
+        """Move pending keys into sorted runs.
+
+        Args:
+            size: The least amount (int) of pending keys to move; nothing is
+            moved while there are fewer of them.
+
+        Notes:
+            A new run is merged with the previous ones while they are less
+            than twice as large, so there are about log2(n / FLUSH_SIZE)
+            runs and every key is merged that many times.
+        """
+        if not self.pending or len(self.pending) < size:
+            return
+
+        import numpy as np
+
+        run = np.fromiter(
+            self.pending, dtype=np.int64, count=len(self.pending)
+        )
+        run.sort()
+        self.pending = set()
+        self.pending_names = {}
+
+        while self.runs and len(self.runs[-1]) <= 2 * len(run):
+            run = np.concatenate((self.runs.pop(), run))
+            run.sort()
+
+        self.runs.append(run)
+
+
+@dataclass
+class Collisions:
+    """A dataclass for resolving collisions of persons' keys.
+
+    Keeps keys (codes of names and date of birth packed into integers, see
+    PersonKeys) of persons generated for an age and sex and how many dates
+    of birth were drawn again because of collisions and how many names were
+    drawn again because all their dates were taken (see resolve_all()).
+    Once half of the dates are taken for a name, its free dates are listed
+    and drawn directly. Dates are drawn again from the stream rng (the
+    global one if it is None).
+    """
+
+    date_table: range
+    person_keys: PersonKeys = field(default_factory=PersonKeys)
+    free_dates: dict[int, list[int]] = field(default_factory=dict)
+    retries: int = 0
+    redrawn: int = 0
+    rng: Optional[random.Random] = None
+
+    def resolve(self, name: tuple[int, int, int], date_of_birth: int) -> int:
+        """Get a date of birth which is still free for a name.
+
+        Args:
+            name: Codes (tuple of int) of a full name: last name, first name
+            and patronymic.
+            date_of_birth: A generated date of birth (int) as days since
+            1970-01-01.
+
+        Returns:
+            The generated date of birth (int) or--if a person with this name
+            and date already exists--a date drawn again from unused ones.
+
+        Raises:
+            UniquenessError: All dates of birth are taken for the name.
+        """
+        prefix = pack_name(name)
+        key = (prefix << DATE_BITS) | (date_of_birth + DATE_OFFSET)
+        in_runs, runs_count = self.person_keys.find_one(key)
+
+        return self.take(
+            name,
+            prefix,
+            date_of_birth,
+            in_runs or key in self.person_keys.pending,
+            runs_count,
+        )
+
+    def resolve_all(
+        self,
+        names: list[tuple[int, int, int]],
+        birthday_lst: list[int],
+        redraw: Optional[Callable[[], tuple[int, int, int]]] = None,
+    ) -> list[int]:
+        """Get dates of birth which are still free for names (see resolve()).
+
+        Args:
+            names: Codes (list of tuples of int) of full names.
+            birthday_lst: Generated dates of birth (list of int).
+            redraw: A function drawing codes (tuple of int) of a new full
+            name; if passed, a name whose dates of birth are all taken is
+            replaced in names by new ones until a name has a free date.
+
+        Returns:
+            A list (of int) of dates of birth, one for each name.
+
+        Raises:
+            UniquenessError: All dates of birth are taken for a name and
+            redraw is not passed.
+
+        Notes:
+            Keys are looked up in sorted runs of person_keys at once (see
+            PersonKeys.find()), only pending keys are checked one by one;
+            pending keys are moved into runs after the batch.
+        """
+        person_keys = self.person_keys
+        prefixes = [
+            (((last << FIRST_BITS) | first) << PATRONYMIC_BITS) | patronymic
+            for last, first, patronymic in names
+        ]
+        keys = [
+            (prefix << DATE_BITS) | (date + DATE_OFFSET)
+            for prefix, date in zip(prefixes, birthday_lst)
+        ]
+        found = person_keys.find(keys, prefixes)
+
+        if found is None:
+            found = ([False] * len(keys), [0] * len(keys))
+
+        capacity = len(self.date_table)
+        half = capacity // 2
+        pending = person_keys.pending
+        pending_names = person_keys.pending_names
+        date_lst: list[int] = []
+
+        for i, (name, prefix, date, key, in_runs, runs_count) in enumerate(
+            zip(names, prefixes, birthday_lst, keys, *found)
+        ):
+            name_count = runs_count + pending_names.get(prefix, 0)
+
+            # The common case: a free date of a name with few persons.
+            if not in_runs and key not in pending and name_count < half:
+                pending.add(key)
+                pending_names[prefix] = name_count - runs_count + 1
+                date_lst.append(date)
+            else:
+                while redraw is not None and name_count >= capacity:
+                    name = names[i] = redraw()
+                    prefix = pack_name(name)
+                    key = (prefix << DATE_BITS) | (date + DATE_OFFSET)
+                    in_runs = key in person_keys
+                    runs_count = person_keys.count_runs(prefix)
+                    name_count = runs_count + pending_names.get(prefix, 0)
+                    self.redrawn += 1
+
+                is_taken = in_runs or key in pending
+                date_lst.append(
+                    self.take(name, prefix, date, is_taken, runs_count)
+                )
+
+        person_keys.flush(FLUSH_SIZE)
+
+        return date_lst
+
+    def take(
+        self,
+        name: tuple[int, int, int],
+        prefix: int,
+        date_of_birth: int,
+        is_taken: bool,
+        runs_count: int,
+    ) -> int:
+        """Take a free date of birth for a name and add its key.
+
+        Args:
+            name: Codes (tuple of int) of a full name.
+            prefix: Packed codes (int) of the name (see pack_name()).
+            date_of_birth: A generated date of birth (int).
+            is_taken: Whether the key of the name and date is already taken
+            (bool).
+            runs_count: An amount (int) of keys of the name in sorted runs
+            of person_keys.
+
+        Returns:
+            A date of birth (int) which was free for the name.
+
+        Raises:
+            UniquenessError: All dates of birth are taken for the name.
+        """
+        person_keys = self.person_keys
+        rng = self.rng or random
+        capacity = len(self.date_table)
+        name_count = runs_count + person_keys.pending_names.get(prefix, 0)
+        lower = prefix << DATE_BITS
+
+        if name_count >= capacity:
+            full_name = ' '.join(
+                vocabulary[code]
+                for vocabulary, code in zip(
+                    (LAST_NAMES, FIRST_NAMES, PATRONYMICS), name
+                )
+            )
+            raise UniquenessError(
+                f'Unable to generate unique person "{full_name}": '
+                + f'all {capacity} dates of birth are already taken.'
+            )
+
+        if 2 * name_count >= capacity:
+            if prefix not in self.free_dates:
+                self.free_dates[prefix] = [
+                    date
+                    for date in self.date_table
+                    if (lower | (date + DATE_OFFSET)) not in person_keys
+                ]
+            free_dates = self.free_dates[prefix]
+
+            if is_taken:
+                self.retries += 1
+
+            i = rng.randrange(len(free_dates))
+            free_dates[i], free_dates[-1] = free_dates[-1], free_dates[i]
+            date_of_birth = free_dates.pop()
+        elif is_taken:
+            while True:
+                date_of_birth = rng.choice(self.date_table)
+                self.retries += 1
+
+                if (lower | (date_of_birth + DATE_OFFSET)) not in person_keys:
+                    break
+
+        person_keys.add(lower | (date_of_birth + DATE_OFFSET))
+
+        return date_of_birth
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A dataclass for shards of a dataset.
+
+    Every shard has fixed amounts of persons of each age and sex and its own
+    part of every space of unique values: dates of birth (see
+    birthday.gen_date_table()), numbers of emails (see email.gen_address())
+    and positions of phones; so shards are generated independently and
+    their records never collide. Streams of random numbers of a shard are
+    derived from the seed of the dataset and the index (see
+    seeding.gen_streams()).
+    """
+
+    index: int
+    count: int
+    start: int
+    amounts: tuple[int, ...]
+    seed: int
+
+    @property
+    def size(self) -> int:
+        return sum(self.amounts)
+
+
+def pack_name(name: tuple[int, int, int]) -> int:
+    """Pack codes of a full name into an integer.
+
+    Args:
+        name: Codes (tuple of int) of a last name, a first name and a
+        patronymic (positions in vocabularies).
+
+    Returns:
+        An integer (int) holding the codes in its bits: the last name above
+        the first name above the patronymic; with a date of birth below them
+        (DATE_BITS, see PersonKeys) a person fits into 64 bits.
+    """
+    last_code, first_code, patronymic_code = name
+
+    return (
+        ((last_code << FIRST_BITS) | first_code) << PATRONYMIC_BITS
+    ) | patronymic_code
+
+
+@contextmanager
+def pause_gc() -> Iterator[None]:
+    """Pause the cyclic garbage collector while generating data.
+
+    Notes:
+        Generated records and sets of keys hold no reference cycles, but
+        millions of them make every full collection scan all of them again;
+        the collector is enabled again on exit if it was enabled before.
+    """
+    is_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if is_enabled:
+            gc.enable()
+
+
+def calc_groups(total: int) -> list[tuple[Age, str, int]]:
+    """Calculate amounts of persons of each age and sex.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
 
     Returns:
-        A list (lists of str) containing fake Russian personal data.
+        A list of tuples containing an object of dataclass 'Age', a sex (str)
+        and an amount (int) of persons of this age and sex.
     """
-    # 1. Calculate age and sex values.
     ages = [JUNIOR, MIDDLE, SENIOR]
 
-    demography_lst = product(ages, SEX)
-
     amounts = demography.calc_age_amount(total)
 
     amount_lst: list[int] = []
@@ -53,55 +504,743 @@ def gen_base(total: int) -> list[list[str]]:
         amount, female_pcent = group
         amount_lst += demography.calc_sex_amount(amount, female_pcent)
 
-    # 2. Generate dataset.
-    base_dset: list[list[str]] = []
+    return [
+        (age, sex, amount)
+        for (age, sex), amount in zip(product(ages, SEX), amount_lst)
+    ]
 
-    for i, part in enumerate(demography_lst):
-        age, sex = part
-        amount = amount_lst[i]
 
-        last_names = LAST_NAMES_MALE if (sex == 'муж.') else LAST_NAMES_FEMALE
-        if age.group == 'J':
-            first_names = (
-                FIRST_NAMES_MALE_J if (sex == 'муж.') else FIRST_NAMES_FEMALE_J
-            )
-            patronymics = (
-                PATRONYMICS_MALE_J if (sex == 'муж.') else PATRONYMICS_FEMALE_J
-            )
-        if age.group == 'M':
-            first_names = (
-                FIRST_NAMES_MALE_M if (sex == 'муж.') else FIRST_NAMES_FEMALE_M
-            )
-            patronymics = (
-                PATRONYMICS_MALE_M if (sex == 'муж.') else PATRONYMICS_FEMALE_M
+def get_table_names(age: Age, sex: str) -> tuple[str, str, str]:
+    """Get names of tables of last names, first names and patronymics.
+
+    Args:
+        age: An object of dataclass 'Age' for a certain age.
+        sex: A value (str) from SEX.
+
+    Returns:
+        A tuple of names (str) of tables of the pack (see pack.get_table())
+        with last names, first names and patronymics for the age and sex.
+    """
+    sex_name = 'MALE' if (sex == 'муж.') else 'FEMALE'
+
+    return (
+        f'LAST_NAMES_{sex_name}',
+        f'FIRST_NAMES_{sex_name}_{age.group}',
+        f'PATRONYMICS_{sex_name}_{age.group}',
+    )
+
+
+def get_tables(age: Age, sex: str) -> tuple[Table, Table, Table]:
+    """Get tables of last names, first names and patronymics.
+
+    Args:
+        age: An object of dataclass 'Age' for a certain age.
+        sex: A value (str) from SEX.
+
+    Returns:
+        A tuple of objects of namedtuple 'Table' with last names, first names
+        and patronymics for the age and sex (loaded on first use).
+    """
+    last_names, first_names, patronymics = (
+        pack.get_table(name) for name in get_table_names(age, sex)
+    )
+
+    return last_names, first_names, patronymics
+
+
+def gen_base(total: int) -> list[list[int]]:
+    """Generate a dataset of fake Russian data (name, sex, date of birth).
+
+    Args:
+        total: A total amount (int) of records/fake persons; from user input.
+
+    Returns:
+        A list of five columns (lists of int) of fake Russian personal data:
+        codes of last names, first names and patronymics (positions in
+        vocabularies LAST_NAMES, FIRST_NAMES and PATRONYMICS), codes of sex
+        (positions in SEX) and dates of birth as days since 1970-01-01.
+    """
+    base_columns: list[list[int]] = [[] for _ in PERSONS]
+
+    for age, sex, amount in calc_groups(total):
+        if amount == 0:
+            continue
+
+        collisions = Collisions(birthday.gen_date_table(age))
+        with pause_gc():
+            person_columns = gen_person(
+                age, sex, amount, *get_table_names(age, sex), collisions
             )
-        if age.group == 'S':
-            first_names = (
-                FIRST_NAMES_MALE_S if (sex == 'муж.') else FIRST_NAMES_FEMALE_S
+
+        for codes, person_codes in zip(base_columns, person_columns):
+            codes.extend(person_codes)
+
+        logger.debug(
+            'Age %s, sex %s: %d persons, %d dates of birth drawn again.',
+            age.group,
+            sex,
+            amount,
+            collisions.retries,
+        )
+
+    return shuffle_columns(base_columns)
+
+
+def split_shards(
+    total: int, groups: list[tuple[Age, str, int]], seed: int
+) -> list[Shard]:
+    """Split a dataset into shards.
+
+    Args:
+        total: A total amount (int) of records/fake persons; from user input.
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        seed: A seed (int) of the dataset.
+
+    Returns:
+        A list of objects of dataclass 'Shard': one per SHARD_SIZE records
+        (at least one), sizes of shards differ by one record at most and
+        amounts of each age and sex add up to the amounts of groups.
+    """
+    count = max(1, -(-total // SHARD_SIZE))
+    amount_lst = [amount for _, _, amount in groups]
+    rng = seeding.get_rng(seed, 'shards')
+    shards: list[Shard] = []
+    start = 0
+
+    for index in range(count):
+        size = total // count + (index < total % count)
+        split_lst = demography.split_amount(size, amount_lst, rng)
+        amount_lst = [
+            amount - taken for amount, taken in zip(amount_lst, split_lst)
+        ]
+        shards.append(Shard(index, count, start, tuple(split_lst), seed))
+        start += size
+
+    return shards
+
+
+def calc_excess(mean: float, capacity: int) -> float:
+    """Calculate how many persons of a name are expected beyond a capacity.
+
+    Args:
+        mean: A mean amount (float) of persons with the name; the amount is
+        taken as Poisson distributed.
+        capacity: An amount (int) of dates of birth for the name.
+
+    Returns:
+        The expected amount (float) of persons beyond the capacity, i.e.
+        E[max(X - capacity, 0)] = mean - capacity + E[max(capacity - X, 0)]
+        for X ~ Poisson(mean); the last term is a finite sum.
+    """
+    if mean <= 0:
+        return 0.0
+
+    shortfall = sum(
+        (capacity - k)
+        * math.exp(k * math.log(mean) - mean - math.lgamma(k + 1))
+        for k in range(capacity)
+    )
+
+    return max(0.0, mean - capacity + shortfall)
+
+
+def check_capacity(
+    shards: list[Shard], groups: list[tuple[Age, str, int]]
+) -> None:
+    """Check that dates of birth of every shard suffice for frequent names.
+
+    Args:
+        shards: Objects of dataclass 'Shard' (list) from split_shards().
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+
+    Raises:
+        UniquenessError: Persons sharing the most frequent name of an age
+        and sex would outnumber dates of birth of a shard too often.
+
+    Notes:
+        Every shard owns every shards-th date of the age (see
+        birthday.gen_date_table()). Names are drawn at random, so persons of
+        a shard sharing a name are about Poisson distributed; those beyond
+        the dates of the shard get other names drawn again (see
+        Collisions.resolve_all()). The expected share of them among persons
+        with the most frequent name (see calc_excess()) must not exceed
+        MAX_REDRAWN; up to about 55M records pass, the names of any dataset
+        fit into the dates of birth up to about 74M (see counter).
+    """
+    for i, (age, sex, _) in enumerate(groups):
+        amount = max(shard.amounts[i] for shard in shards)
+
+        if amount == 0:
+            continue
+
+        share = 1.0
+        for table in get_tables(age, sex):
+            _, weights, _ = reader.to_table(table)
+            share *= max(weights) / sum(weights)
+
+        mean = share * amount
+        capacity = len(birthday.gen_date_table(age)) // len(shards)
+
+        if calc_excess(mean, capacity) > MAX_REDRAWN * mean:
+            raise UniquenessError(
+                f'Unable to generate {sum(shard.size for shard in shards)} '
+                + f'unique persons (age {age.group}, sex {sex}): only '
+                + f'{capacity} dates of birth for a name in a shard of '
+                + f'{SHARD_SIZE} records.'
             )
-            patronymics = (
-                PATRONYMICS_MALE_S if (sex == 'муж.') else PATRONYMICS_FEMALE_S
+
+
+def iter_persons(
+    total: int,
+    data: str = 'base',
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> Iterator[dict[str, list[Any]]]:
+    """Generate a dataset of fake Russian persons in chunks.
+
+    Args:
+        total: A total amount (int) of records/fake persons; from user input.
+        data: A type (str) of generated data - "base" (personal info),
+        "contact" (and contacts), "location" (and localities) or "full".
+        chunk_size: An amount (int) of records in every chunk (but the last).
+        workers: An amount (int) of processes generating shards, from 1 to
+        WINDOW_SIZE (shards of one window are generated at a time).
+        seed: A seed (int) of the dataset; a new one is drawn from the global
+        random generator if not passed.
+
+    Returns:
+        An iterator over chunks as columns (dict, see to_columns()) of
+        personal data and--if they were chosen--phones, emails, regions and
+        localities.
+
+    Raises:
+        UniquenessError: Dates of birth of a shard would not suffice for the
+        most frequent names too often (see check_capacity()), checked before
+        any record is generated.
+        ValueError: There are not enough phones for contacts or workers
+        are out of range.
+
+    Notes:
+        The dataset is split into shards (see split_shards()) generated in
+        blocks of BATCH_SIZE records; blocks of WINDOW_SIZE shards at a time
+        are taken in turn (see iter_windows()) and cut into chunks, so the
+        order of records depends neither on workers nor on chunk_size. Every
+        block takes persons of each age and sex in proportion to the amounts
+        left in its shard. Persons' keys stay unique across blocks (see
+        PersonKeys, the only state growing with a shard), emails are unique
+        by their counters of pairs of names (see email.gen_address()) and
+        phones are taken from consecutive positions of one permutation.
+        Every shard draws from its own streams of random numbers (see
+        seeding.gen_streams()), so a dataset depends only on total, data and
+        seed.
+
+        The state of a shard is dropped once the shard is finished, so
+        memory depends on chunk_size and WINDOW_SIZE but not on total: about
+        5 MB of keys and dates per active shard (WINDOW_SIZE shards at most)
+        plus the records of a chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError('The size of a chunk must be positive.')
+    if not 1 <= workers <= WINDOW_SIZE:
+        raise ValueError(
+            f'The amount of workers must be from 1 to {WINDOW_SIZE}.'
+        )
+    if data in ('contact', 'full') and total > phone.CAPACITY:
+        raise ValueError(
+            f'Unable to generate {total} unique phones, '
+            + f'only {phone.CAPACITY} phone numbers are available.'
+        )
+
+    seed = seeding.gen_seed(seed)
+    groups = calc_groups(total)
+    shards = split_shards(total, groups, seed)
+    check_capacity(shards, groups)
+    phone_key = seeding.get_rng(seed, 'phone').getrandbits(64)
+    workers = min(workers, len(shards))
+
+    if workers > 1:
+        blocks = iter_parallel(shards, groups, data, phone_key, workers)
+    else:
+        blocks = iter_windows(shards, groups, data, phone_key)
+
+    yield from rechunk(blocks, chunk_size)
+
+
+def iter_shard(
+    shard: Shard,
+    groups: list[tuple[Age, str, int]],
+    data: str,
+    phone_key: int,
+) -> Iterator[dict[str, list[Any]]]:
+    """Generate a shard of a dataset in blocks.
+
+    Args:
+        shard: An object of dataclass 'Shard'.
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        data: A type (str) of generated data (see iter_persons()).
+        phone_key: A key (int) of the permutation of phones of the dataset.
+
+    Returns:
+        An iterator over blocks of BATCH_SIZE records (but the last) as
+        columns (dict, see to_columns()).
+
+    Raises:
+        UniquenessError: All dates of birth are taken for a generated name.
+    """
+    streams = seeding.gen_streams(shard.seed, shard.index)
+    amount_lst = list(shard.amounts)
+    collisions_lst = [
+        Collisions(
+            birthday.gen_date_table(age, shard.index, shard.count),
+            rng=streams.birthdays,
+        )
+        for age, _, _ in groups
+    ]
+    is_contact = data in ('contact', 'full')
+    is_location = data in ('location', 'full')
+    email_ranks = email.new_ranks() if is_contact else None
+    localities = 'LOCALITIES' if is_location else None
+
+    for offset in range(0, shard.size, BATCH_SIZE):
+        size = min(BATCH_SIZE, shard.size - offset)
+
+        with pause_gc():
+            block = gen_block(
+                shard,
+                streams,
+                shard.start + offset,
+                size,
+                groups,
+                amount_lst,
+                collisions_lst,
+                phone_key if is_contact else None,
+                email_ranks,
+                localities,
             )
 
-        dset = gen_person(
-            age, sex, amount, last_names, first_names, patronymics
+        yield block
+
+    for (age, sex, _), amount, collisions in zip(
+        groups, shard.amounts, collisions_lst
+    ):
+        logger.debug(
+            'Shard %d, age %s, sex %s: %d persons, '
+            + '%d dates of birth and %d names drawn again.',
+            shard.index,
+            age.group,
+            sex,
+            amount,
+            collisions.retries,
+            collisions.redrawn,
+        )
+
+
+def gen_block(
+    shard: Shard,
+    streams: Streams,
+    start: int,
+    size: int,
+    groups: list[tuple[Age, str, int]],
+    amount_lst: list[int],
+    collisions_lst: list[Collisions],
+    phone_key: Optional[int],
+    email_ranks: Optional[list[int]],
+    localities: Optional[str],
+) -> dict[str, list[Any]]:
+    """Generate a block of a shard (see iter_shard()).
+
+    Args:
+        shard: An object of dataclass 'Shard'.
+        streams: Streams of random numbers (namedtuple 'Streams') of the
+        shard.
+        start: A position (int) of the first record of the block.
+        size: An amount (int) of records in the block.
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        amount_lst: Amounts (list of int) of persons left in each group of
+        the shard; decreased by persons of the block.
+        collisions_lst: Objects of dataclass 'Collisions' (list) for each
+        group of the shard.
+        phone_key: A key (int) of the permutation of phones or None if
+        contacts are not generated.
+        email_ranks: Counters of emails of pairs of names (list of int, see
+        email.new_ranks()) of the shard or None if contacts are not
+        generated.
+        localities: A name (str) of the table of localities or None if they
+        are not generated.
+
+    Returns:
+        A dict mapping names of columns to lists of values of the block.
+    """
+    split_lst = demography.split_amount(size, amount_lst, streams.records)
+    base_columns: list[list[int]] = [[] for _ in PERSONS]
+
+    for i, (age, sex, _) in enumerate(groups):
+        if split_lst[i] == 0:
+            continue
+
+        person_columns = gen_person(
+            age,
+            sex,
+            split_lst[i],
+            *get_table_names(age, sex),
+            collisions_lst[i],
+            streams.names,
+            redraw=True,
+        )
+        for codes, person_codes in zip(base_columns, person_columns):
+            codes.extend(person_codes)
+        amount_lst[i] -= split_lst[i]
+
+    base_columns = shuffle_columns(base_columns, streams.records)
+    columns = to_columns(base_columns)
+
+    if phone_key is not None:
+        columns['Телефон'] = phone.gen_phone(size, start, phone_key)
+        columns['E-mail'] = email.gen_email(
+            base_columns,
+            email_ranks,
+            shard.index,
+            shard.count,
+            streams.emails,
+        )
+    if localities is not None:
+        location_columns = gen_location(size, localities, streams.locations)
+        for column, values in zip(LOCATIONS, location_columns):
+            columns[column] = values
+
+    return columns
+
+
+def interleave(
+    block_iters: list[Iterator[dict[str, list[Any]]]]
+) -> Iterator[dict[str, list[Any]]]:
+    """Take blocks of shards in turn.
+
+    Args:
+        block_iters: Iterators (list) over blocks of shards.
+
+    Returns:
+        An iterator over the first blocks of all shards, then the second
+        ones and so on; exhausted shards are skipped.
+    """
+    active = list(block_iters)
+
+    while active:
+        for block_iter in list(active):
+            block = next(block_iter, None)
+
+            if block is None:
+                active.remove(block_iter)
+            else:
+                yield block
+
+
+def iter_windows(
+    shards: list[Shard],
+    groups: list[tuple[Age, str, int]],
+    data: str,
+    phone_key: int,
+) -> Iterator[dict[str, list[Any]]]:
+    """Generate shards in blocks, a window of shards at a time.
+
+    Args:
+        shards: Objects of dataclass 'Shard' (list) ordered by index; all
+        shards of a dataset or those of a worker.
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        data: A type (str) of generated data (see iter_persons()).
+        phone_key: A key (int) of the permutation of phones of the dataset.
+
+    Returns:
+        An iterator over blocks of shards with the same index //
+        WINDOW_SIZE taken in turn (see interleave()), then blocks of the
+        next window; shards of a window are started only when the previous
+        window is finished.
+    """
+    for _, window in groupby(
+        shards, key=lambda shard: shard.index // WINDOW_SIZE
+    ):
+        yield from interleave(
+            [iter_shard(shard, groups, data, phone_key) for shard in window]
+        )
+
+
+def run_worker(
+    shards: list[Shard],
+    groups: list[tuple[Age, str, int]],
+    data: str,
+    phone_key: int,
+    queue: Any,
+) -> None:
+    """Generate shards in a worker process (see iter_parallel()).
+
+    Args:
+        shards: Objects of dataclass 'Shard' (list) of the worker.
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        data: A type (str) of generated data (see iter_persons()).
+        phone_key: A key (int) of the permutation of phones of the dataset.
+        queue: A queue (multiprocessing) for blocks of the shards in turn
+        or an exception raised by generation.
+    """
+    try:
+        for block in iter_windows(shards, groups, data, phone_key):
+            queue.put(block)
+    except Exception as error:
+        queue.put(error)
+
+
+def iter_parallel(
+    shards: list[Shard],
+    groups: list[tuple[Age, str, int]],
+    data: str,
+    phone_key: int,
+    workers: int,
+) -> Iterator[dict[str, list[Any]]]:
+    """Generate shards in worker processes.
+
+    Args:
+        shards: Objects of dataclass 'Shard' (list).
+        groups: Ages, sexes and amounts (list of tuples) from calc_groups().
+        data: A type (str) of generated data (see iter_persons()).
+        phone_key: A key (int) of the permutation of phones of the dataset.
+        workers: An amount (int) of processes (up to WINDOW_SIZE); shards
+        are dealt to them in turn.
+
+    Returns:
+        An iterator over blocks in the same order as iter_windows() gives
+        for all shards; every worker keeps up to QUEUE_SIZE blocks ahead.
+
+    Raises:
+        UniquenessError: All dates of birth are taken for a generated name.
+        RuntimeError: A worker process exited without passing its blocks
+        or an error (e.g. it was killed); checked every QUEUE_TIMEOUT
+        seconds while waiting for a block.
+    """
+    import multiprocessing
+    import queue
+
+    context = multiprocessing.get_context()
+    queues = [context.Queue(QUEUE_SIZE) for _ in range(workers)]
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(shards[i::workers], groups, data, phone_key, queues[i]),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    is_done = False
+
+    for process in processes:
+        process.start()
+
+    try:
+        for window_start in range(0, len(shards), WINDOW_SIZE):
+            window = shards[window_start : window_start + WINDOW_SIZE]
+            rounds = -(-max(shard.size for shard in window) // BATCH_SIZE)
+
+            for round_idx in range(rounds):
+                for shard in window:
+                    if round_idx * BATCH_SIZE >= shard.size:
+                        continue
+
+                    worker = shard.index % workers
+
+                    while True:
+                        # A worker is dead only if it had exited before the
+                        # wait: then its blocks would be in the queue.
+                        is_alive = processes[worker].is_alive()
+
+                        try:
+                            block = queues[worker].get(timeout=QUEUE_TIMEOUT)
+                            break
+                        except queue.Empty:
+                            if not is_alive:
+                                raise RuntimeError(
+                                    f'Worker process {worker} exited with '
+                                    + f'code {processes[worker].exitcode} '
+                                    + 'before generating its shards.'
+                                ) from None
+
+                    if isinstance(block, Exception):
+                        raise block
+
+                    yield block
+
+        is_done = True
+    finally:
+        for process in processes:
+            if not is_done:
+                process.terminate()
+            process.join()
+
+
+def rechunk(
+    blocks: Iterator[dict[str, list[Any]]], chunk_size: int
+) -> Iterator[dict[str, list[Any]]]:
+    """Cut a stream of blocks into chunks.
+
+    Args:
+        blocks: An iterator over blocks as columns (dict).
+        chunk_size: An amount (int) of records in every chunk (but the last).
+
+    Returns:
+        An iterator over chunks as columns (dict) with the same records.
+    """
+    chunk: dict[str, list[Any]] = {}
+    size = 0
+
+    for block in blocks:
+        block_size = len(block[PERSONS[0]])
+        offset = 0
+
+        while offset < block_size:
+            taken = min(chunk_size - size, block_size - offset)
+
+            for column, values in block.items():
+                chunk.setdefault(column, []).extend(
+                    values[offset : offset + taken]
+                )
+
+            size += taken
+            offset += taken
+
+            if size == chunk_size:
+                yield chunk
+                chunk = {}
+                size = 0
+
+    if size:
+        yield chunk
+
+
+def shuffle_columns(
+    base_columns: list[list[int]], rng: Optional[random.Random] = None
+) -> list[list[int]]:
+    """Shuffle records of columns of a base dataset.
+
+    Args:
+        base_columns: Columns (list of lists of int) of a base dataset.
+        rng: A stream of random numbers (the global one if not passed).
+
+    Returns:
+        New columns (list of lists of int) with records in one random order:
+        one permutation of positions is applied to every column.
+
+    Notes:
+        Permutations of BATCH_SIZE positions and more are drawn by numpy
+        (seeded from rng), smaller ones by shuffling a list; columns are
+        gathered by operator.itemgetter() without touching values in Python.
+    """
+    size = len(base_columns[0])
+    rng = rng or random
+
+    if size < 2:
+        return [list(codes) for codes in base_columns]
+
+    if size < BATCH_SIZE:
+        order = list(range(size))
+        rng.shuffle(order)
+    else:
+        import numpy as np
+
+        order = (
+            np.random.default_rng(rng.getrandbits(64))
+            .permutation(size)
+            .tolist()
+        )
+
+    gather = itemgetter(*order)
+
+    return [list(gather(codes)) for codes in base_columns]
+
+
+def to_columns(base_columns: list[list[int]]) -> dict[str, list[Any]]:
+    """Convert columns of a base dataset to columns of values.
+
+    Args:
+        base_columns: Columns (list of lists of int) of codes of names and
+        sex and dates of birth (days since 1970-01-01), see gen_base().
+
+    Returns:
+        A dict mapping names of columns (PERSONS) to lists of names and sex
+        (str, shared with vocabularies) and dates of birth (int).
+    """
+    columns: dict[str, list[Any]] = {
+        column: list(map(vocabulary.__getitem__, codes))
+        for column, codes, vocabulary in zip(
+            PERSONS,
+            base_columns,
+            (LAST_NAMES, FIRST_NAMES, PATRONYMICS, SEX),
+        )
+    }
+    columns['Дата рождения'] = list(base_columns[4])
+
+    return columns
+
+
+def to_frame(
+    columns: dict[str, list[Any]], indexes: Optional[range] = None
+) -> 'pd.DataFrame':
+    """Convert columns of a dataset to a pandas DataFrame.
+
+    Args:
+        columns: A dict mapping names of columns to lists of values (see
+        to_columns()).
+        indexes: Positions (range of int) of the records in the dataset;
+        from 0 to the amount of records if not passed.
+
+    Returns:
+        A pandas DataFrame with names, sex, regions and localities as
+        categorical columns (on vocabularies and the table of localities),
+        dates of birth as datetime64 and IDs (positions from 1) as the index.
+
+    Notes:
+        Every column is converted once and the frame is built from the
+        converted arrays without copying them again.
+    """
+    import pandas as pd
+
+    frame_columns: dict[str, Any] = dict(columns)
+    vocabularies = [LAST_NAMES, FIRST_NAMES, PATRONYMICS, SEX]
+
+    if LOCATIONS[0] in columns:
+        localities = pack.get_table('LOCALITIES')
+        vocabularies += [
+            sorted(set(localities.regions or ())),
+            sorted(set(localities.names)),
+        ]
+
+    for column, vocabulary in zip(PERSONS[:4] + LOCATIONS, vocabularies):
+        frame_columns[column] = pd.Categorical(
+            columns[column], categories=vocabulary
         )
 
-        base_dset.extend(dset)
+    frame_columns['Дата рождения'] = pd.to_datetime(
+        columns['Дата рождения'], unit='D'
+    )
 
-    random.shuffle(base_dset)
+    if indexes is None:
+        indexes = range(len(columns[PERSONS[0]]))
 
-    return base_dset
+    ids = pd.RangeIndex(
+        indexes.start + 1, indexes.stop + 1, indexes.step, name='ID'
+    )
+
+    return pd.DataFrame(frame_columns, index=ids, copy=False)
 
 
 def gen_person(
     age: Age,
     sex: str,
     amount: int,
-    last_names: dict[str, float],
-    first_names: dict[str, float],
-    patronymics: dict[str, float],
-) -> list[list[str]]:
+    last_names: Union[dict[str, float], Table, str],
+    first_names: Union[dict[str, float], Table, str],
+    patronymics: Union[dict[str, float], Table, str],
+    collisions: Optional[Collisions] = None,
+    rng: Optional[random.Random] = None,
+    redraw: bool = False,
+) -> list[list[int]]:
     """Generate fake Russian data (name, sex, date of birth).
 
     Args:
@@ -109,93 +1248,115 @@ def gen_person(
         sex: A value(str) from namedtuple 'Sex'.
         amount: An amount (int) of male/female persons of a certain age.
         last_names: A Russian last names (dict) mapping names(keys, str) and
-        their weights (values, float).
+        their weights (values, float) or an object of namedtuple 'Table'.
         first_names: A Russian last names (dict) mapping names(keys, str) and
-        their weights (values, float).
+        their weights (values, float) or an object of namedtuple 'Table'.
         patronymics: A Russian last names (dict) mapping names(keys, str) and
-        their weights (values, float).
+        their weights (values, float) or an object of namedtuple 'Table'.
+        Tables may be passed by their names (str, see get_table_names()) to
+        use samplers cached by reader.get_sampler().
+        collisions: An object of dataclass 'Collisions' keeping persons
+        generated before for the age and sex (a new one if not passed);
+        dates of birth are drawn from its stream.
+        rng: A stream of random numbers for names (the global one if not
+        passed).
+        redraw: Whether a name whose dates of birth are all taken is drawn
+        again (see Collisions.resolve_all()) instead of raising an error.
 
     Returns:
-        A list (of lists of str) containing fake Russan personal data (name,
-        sex, date of birth) of a certain sex and age.
-    """
-    person_lst: list[list[str]] = []
-    person_dict: dict[tuple[str, str, str, str], list[str]] = {}
-    birthday_dq = deque(birthday.gen_birthday(age, amount))
+        A list of five columns (lists of int) containing fake Russan personal
+        data (codes of names and sex, dates of birth as days since 1970-01-01)
+        of a certain sex and age, see gen_base().
 
-    last_names_dq = deque(reader.read_name(amount, last_names))
-    first_names_dq = deque(reader.read_name(amount, first_names))
-    patronymics_dq = deque(reader.read_name(amount, patronymics))
+    Raises:
+        UniquenessError: All dates of birth are taken for a generated name
+        and redraw is False.
+    """
+    if collisions is None:
+        collisions = Collisions(birthday.gen_date_table(age))
 
-    for i in range(amount):
-        last_name = last_names_dq.popleft()
-        first_name = first_names_dq.popleft()
-        patronymic = patronymics_dq.popleft()
-        date_of_birth = birthday_dq.popleft()
+    sex_code = SEX.index(sex)
 
-        person_key = (last_name, first_name, patronymic, date_of_birth)
+    birthday_lst = birthday.gen_birthday(
+        age, amount, collisions.date_table, collisions.rng
+    )
+    last_name_lst = reader.read_code(amount, last_names, LAST_NAMES, rng)
+    first_name_lst = reader.read_code(amount, first_names, FIRST_NAMES, rng)
+    patronymic_lst = reader.read_code(amount, patronymics, PATRONYMICS, rng)
 
-        while person_key in person_dict:
-            birthday_dq.append(date_of_birth)
-            date_of_birth = birthday_dq.popleft()
-            person_key = (last_name, first_name, patronymic, date_of_birth)
+    def redraw_name() -> tuple[int, int, int]:
+        return (
+            reader.read_code(1, last_names, LAST_NAMES, rng)[0],
+            reader.read_code(1, first_names, FIRST_NAMES, rng)[0],
+            reader.read_code(1, patronymics, PATRONYMICS, rng)[0],
+        )
 
-        person_dict[person_key] = [
-            last_name,
-            first_name,
-            patronymic,
-            sex,
-            date_of_birth,
-        ]
+    names = list(zip(last_name_lst, first_name_lst, patronymic_lst))
+    redrawn = collisions.redrawn
+    birthday_lst = collisions.resolve_all(
+        names, birthday_lst, redraw_name if redraw else None
+    )
 
-    person_lst = list(person_dict.values())
+    if collisions.redrawn > redrawn:
+        last_name_lst, first_name_lst, patronymic_lst = map(
+            list, zip(*names)
+        )
 
-    return person_lst
+    return [
+        last_name_lst,
+        first_name_lst,
+        patronymic_lst,
+        [sex_code] * amount,
+        birthday_lst,
+    ]
 
 
-def gen_contact(total: int, base_dset: list[list[str]]) -> zip:
+def gen_contact(
+    total: int, base_columns: list[list[int]]
+) -> tuple[list[int], list[str]]:
     """Generate a dataset of fake Russian contacts (cell phone numbers, emails).
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
-        base_dset: A dataset (list of lists of str) containing fake Russian
-        personal data, including names and date of birth.
+        base_columns: Columns (list of lists of int) of fake Russian personal
+        data, including codes of names and dates of birth (see gen_base()).
 
     Returns:
-        A zipped tupple aggregating lists (of str) with fake Russian phones
-        and emails.
+        A tuple of columns: fake Russian phones (list of int, rendered as
+        strings only by outputs) and emails (list of str).
     """
     phone_lst = phone.gen_phone(total)
-    email_lst = email.gen_email(base_dset)
+    email_lst = email.gen_email(base_columns)
 
-    contact_dset = zip(phone_lst, email_lst)
-
-    return contact_dset
+    return phone_lst, email_lst
 
 
 def gen_location(
-    total: int, localities_dict: dict[str, tuple[str, float]]
-) -> zip:
+    total: int,
+    localities_dict: Union[dict[str, tuple[str, float]], Table, str],
+    rng: Optional[random.Random] = None,
+) -> tuple[list[str], list[str]]:
     """Generate dataset of Russian locations (region and populated locality.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
         localities_dict: Russian locations (dict) mapping populated localities
-        (keys, str) and their regions and weights (values, tuple of str).
+        (keys, str) and their regions and weights (values, tuple of str) or an
+        object of namedtuple 'Table' (e.g. pack.get_table('LOCALITIES')) or
+        its name, 'LOCALITIES' (see reader.read_location()).
+        rng: A stream of random numbers (the global one if not passed).
 
     Returns:
-        A zipped tuple aggregating lists (of str) with Russian regions and
-        populated localities.
+        A tuple of columns (lists of str) with Russian regions and populated
+        localities.
     """
     region_lst: list[str] = []
     locality_lst: list[str] = []
 
-    location_lst = reader.read_location(total, localities_dict)
+    location_lst = reader.read_location(total, localities_dict, rng)
 
     for location in location_lst:
         region_lst.append(location[0])
         locality_lst.append(location[1])
 
-    location_dset = zip(region_lst, locality_lst)
-
-    return location_dset
+    return region_lst, locality_lst
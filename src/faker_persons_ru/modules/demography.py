@@ -2,6 +2,7 @@
 import random
 
 from dataclasses import dataclass
+from typing import Optional
 
 SEX = ['муж.', 'жен.']
 
@@ -71,6 +72,47 @@ def calc_sex_amount(age_amount: int, female_pcent: float) -> tuple[int, int]:
     return male_amount, female_amount
 
 
+def split_amount(
+    amount: int,
+    group_amounts: list[int],
+    rng: Optional[random.Random] = None,
+) -> list[int]:
+    """Split an amount of persons between groups in proportion to their sizes.
+
+    Args:
+        amount: An amount (int) of persons to take; not more than the sum of
+        group_amounts.
+        group_amounts: Amounts (list of int) of persons left in each group.
+        rng: A stream of random numbers (the global one if not passed).
+
+    Returns:
+        A list (of int) representing amounts of persons taken from each
+        group: every group gets its share rounded down, the rest goes to
+        groups drawn at random with weights of their remainders.
+    """
+    left = sum(group_amounts)
+
+    if amount >= left:
+        return list(group_amounts)
+
+    split_lst: list[int] = []
+    remainders: list[int] = []
+
+    for group_amount in group_amounts:
+        share, remainder = divmod(amount * group_amount, left)
+        split_lst.append(share)
+        remainders.append(remainder)
+
+    for _ in range(amount - sum(split_lst)):
+        i = (rng or random).choices(
+            range(len(remainders)), weights=remainders
+        )[0]
+        split_lst[i] += 1
+        remainders[i] = 0
+
+    return split_lst
+
+
 JUNIOR = Age('J', 0.27, 1990, 2004, 0.49)
 MIDDLE = Age('M', 0.42, 1973, 1989, 0.51)
 SENIOR = Age('S', 0.31, 1958, 1972, 0.55)
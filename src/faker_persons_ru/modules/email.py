@@ -1,6 +1,11 @@
 """Module for generating fake Russian emails based on fake Russian persons."""
 import random
 
+from typing import Optional, Sequence
+
+from faker_persons_ru.modules import birthday
+from faker_persons_ru.data.vocabularies import LAST_NAMES, FIRST_NAMES
+
 TRANSLIT: dict[str, str] = {
     'а': 'a',
     'б': 'b',
@@ -49,6 +54,7 @@ TRANSLIT: dict[str, str] = {
     '8': '8',
     '9': '9',
 }
+TRANSLIT_TABLE: dict[int, str] = str.maketrans(TRANSLIT)
 PATTERNS: list[str] = [
     '{first_name}.{last_name}',
     '{first_name[0]}.{last_name}',
@@ -94,6 +100,12 @@ PATTERNS: list[str] = [
     '{last_name}-{first_name}-{year[2]}{year[3]}',
     '{last_name}-{first_name[0]}-{year[2]}{year[3]}',
 ]
+FULL_PATTERNS: list[str] = [
+    pattern for pattern in PATTERNS if '[0]' not in pattern
+]
+LOGIN_PATTERNS: list[str] = [
+    pattern for pattern in FULL_PATTERNS if '{year' not in pattern
+]
 DOMAINS: list[str] = [
     '@ruspost.online',
     '@ruspost.net',
@@ -108,37 +120,138 @@ DOMAINS: list[str] = [
 ]
 
 
-def gen_email(base_dset: list[list[str]]) -> list[str]:
+def new_ranks() -> list[int]:
+    """Create counters of email addresses of pairs of names.
+
+    Returns:
+        A list (of int) with an amount of addresses generated for every pair
+        of a last name and a first name (see gen_address()), all zeros.
+    """
+    return [0] * (len(LAST_NAMES) * len(FIRST_NAMES))
+
+
+def gen_email(
+    base_columns: list[list[int]],
+    ranks: Optional[list[int]] = None,
+    shard: int = 0,
+    shards: int = 1,
+    rng: Optional[random.Random] = None,
+) -> list[str]:
     """Generate a dataset of fake Russian email addresses.
 
     Args:
-        base_dset: A dataset (list of lists of str) containing fake Russian
-        personal data, including names and date of birth.
+        base_columns: Columns (list of lists of int) of fake Russian personal
+        data: codes of last names, first names, patronymics and sex and dates
+        of birth (days since 1970-01-01).
+        ranks: Counters of addresses of pairs of names (list of int, see
+        new_ranks()) generated before in the shard; updated.
+        shard: A number (int) of a shard of the dataset.
+        shards: An amount (int) of shards of the dataset.
+        rng: A stream of random numbers (the global one if not passed).
 
     Returns:
         A list of strings containing fake Russian email addresses based on
-        Russian names and--if necessary--years of birth.
+        Russian names and--if necessary--years of birth or numbers.
+
+    Notes:
+        Addresses are unique without keeping them (see gen_address()): the
+        state of a shard is one counter for every pair of names, so it does
+        not grow with the dataset.
     """
-    email_lst: list[str] = []
-    email_dict: dict[str, str] = {}
+    if ranks is None:
+        ranks = new_ranks()
 
-    for i, row in enumerate(base_dset):
-        last_name = row[0]
-        first_name = row[1]
-        year = row[4][:4]
-        var = i % 12
+    email_lst = [
+        gen_address(last_code, first_code, day, ranks, shard, shards, rng)
+        for last_code, first_code, day in zip(
+            base_columns[0], base_columns[1], base_columns[4]
+        )
+    ]
+
+    return email_lst
 
-        email = gen_login(last_name, first_name, year, var)
 
-        while email in email_dict:
-            var += 1
-            email = gen_login(last_name, first_name, year, var)
+def gen_address(
+    last_code: int,
+    first_code: int,
+    day: int,
+    ranks: list[int],
+    shard: int = 0,
+    shards: int = 1,
+    rng: Optional[random.Random] = None,
+) -> str:
+    """Generate a unique email address of one person (see gen_email()).
 
-        email_dict[email] = email
+    Args:
+        last_code: A code (int) of a last name (position in LAST_NAMES).
+        first_code: A code (int) of a first name (position in FIRST_NAMES).
+        day: A date of birth (int) as days since 1970-01-01.
+        ranks: Counters of addresses of pairs of names (list of int, see
+        new_ranks()); updated.
+        shard: A number (int) of a shard of the dataset.
+        shards: An amount (int) of shards of the dataset.
+        rng: A stream of random numbers (the global one if not passed).
 
-    email_lst = list(email_dict.values())
+    Returns:
+        A str containing a fake Russian email address.
 
-    return email_lst
+    Notes:
+        Persons sharing a last and a first name are numbered in turn across
+        shards (rank * shards + shard). The person numbered 0 gets a login of
+        FULL_PATTERNS (maybe with the year of birth), the others a login of
+        LOGIN_PATTERNS followed by the number. Logins hold full names whose
+        transliterations are distinct, have letters only and never match
+        between last and first names (see check_names()), years are always
+        separated and numbers never are, so logins of different persons
+        differ whatever patterns and domains are drawn.
+    """
+    rng = rng or random
+    pair = last_code * len(FIRST_NAMES) + first_code
+    number = ranks[pair] * shards + shard
+    ranks[pair] += 1
+    last_name = LAST_NAMES[last_code]
+    first_name = FIRST_NAMES[first_code]
+
+    if number:
+        login_ru = rng.choice(LOGIN_PATTERNS).format(
+            last_name=last_name, first_name=first_name
+        ) + str(number)
+    else:
+        login_ru = rng.choice(FULL_PATTERNS).format(
+            last_name=last_name,
+            first_name=first_name,
+            year=str(birthday.to_year(day)),
+        )
+
+    return translit_login(login_ru) + rng.choice(DOMAINS)
+
+
+def check_names(last_names: Sequence[str], first_names: Sequence[str]) -> None:
+    """Check that logins of full names identify the names.
+
+    Args:
+        last_names: Russian last names (sequence of str), e.g. LAST_NAMES.
+        first_names: Russian first names (sequence of str), e.g. FIRST_NAMES.
+
+    Raises:
+        ValueError: Transliterations of names repeat, have other characters
+        than letters or are both a last name and a first name, so logins of
+        different persons could match (see gen_address()).
+    """
+    last_set = {translit_login(name) for name in last_names}
+    first_set = {translit_login(name) for name in first_names}
+
+    if len(last_set) < len(set(last_names)):
+        raise ValueError('Transliterations of last names repeat.')
+    if len(first_set) < len(set(first_names)):
+        raise ValueError('Transliterations of first names repeat.')
+    if not all(login.isalpha() for login in last_set | first_set):
+        raise ValueError('Transliterations of names must have letters only.')
+    if last_set & first_set:
+        raise ValueError(
+            'Transliterations of names are both last and first names: '
+            + ', '.join(sorted(last_set & first_set))
+        )
 
 
 def translit_login(login_ru: str) -> str:
@@ -152,31 +265,7 @@ def translit_login(login_ru: str) -> str:
         A string as a transliterated login_ru for generating fake personal
         email address.
     """
-    login_en = ''
-
-    for ch in login_ru.lower():
-        login_en += TRANSLIT[ch]
+    login_en = login_ru.lower().translate(TRANSLIT_TABLE)
 
     return login_en
 
-
-def gen_login(last_name: str, first_name: str, year: str, var: int) -> str:
-    """Generate email address for fake person from name and date of birth.
-
-    Args:
-        last_name: A Russian last name (str).
-        first_name: A Russian first name (str).
-        year: A person's year of birth (str).
-        var: A number (int) for a pattern of email address.
-
-    Returns:
-        A str containing a fake Russian personal email address.
-    """
-    pattern = PATTERNS[var]
-    domain = random.choice(DOMAINS)
-    login_ru = pattern.format(
-        last_name=last_name, first_name=first_name, year=year
-    )
-    email = translit_login(login_ru) + domain
-
-    return email
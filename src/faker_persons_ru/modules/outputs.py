@@ -1,11 +1,37 @@
-"""Module for generating output files (CSV, MS Excel, SQL, SQLite, MySQL)."""
+"""
+Module for generating output files (CSV, MS Excel, SQL, SQLite, MySQL).
+
+Datasets are passed to writers as columns (a dict mapping names of columns
+to lists or numpy arrays of values) or as pandas DataFrames; pandas is
+imported only for MS Excel files. Writers are generators receiving chunks of
+a dataset (see open_writer()), so files are written incrementally; to_csv()
+and the other to_*() functions write a whole dataset at once.
+"""
 import csv
+import os
 import sqlite3
-import sys
-import pandas as pd
 
+from contextlib import ExitStack, closing, contextmanager
+from itertools import count
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator
+from typing import Optional, Sequence, Union
 
+from faker_persons_ru.modules import birthday
+from faker_persons_ru.modules import phone
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PERSON_COLUMNS: list[str] = [
+    'Фамилия',
+    'Имя',
+    'Отчество',
+    'Пол',
+    'Дата рождения',
+]
+CONTACT_COLUMNS: list[str] = ['Телефон', 'E-mail']
+LOCATION_COLUMNS: list[str] = ['Регион', 'Населённый пункт']
 SQL_PERSON_COLUMNS: list[str] = [
     'last_name',
     'first_name',
@@ -15,104 +41,457 @@ SQL_PERSON_COLUMNS: list[str] = [
 ]
 SQL_CONTACT_COLUMNS: list[str] = ['phone', 'email']
 SQL_LOCATION_COLUMNS: list[str] = ['region', 'locality']
-STDOUT = sys.stdout
+MAX_ROWS: int = 60
+MIN_ROWS: int = 10
+EXCEL_MAX_ROWS: int = 1_048_575
+MYSQL_ROWS: int = 1000
 
+Columns = dict[str, Sequence[Any]]
+Writer = Generator[None, Columns, None]
 
-def to_csv(df: pd.DataFrame, output: str, path: Path) -> None:
-    """Generate a comma-separated values (CSV) file.
+
+def get_columns(dataset: Union[Columns, 'pd.DataFrame']) -> Columns:
+    """Get columns of a dataset.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data.
+
+    Returns:
+        A dict mapping names of columns (str) to their values; dates of birth
+        are stored as days since 1970-01-01 (int) and phone numbers (if any)
+        as integers.
+    """
+    if isinstance(dataset, dict):
+        return dataset
+
+    columns: Columns = {}
+
+    for column in dataset.columns:
+        if column == 'Дата рождения':
+            date_arr = dataset[column].to_numpy().astype('datetime64[D]')
+            columns[column] = date_arr.astype('int64').tolist()
+        else:
+            columns[column] = dataset[column].tolist()
+
+    return columns
+
+
+def format_data(
+    dataset: Union[Columns, 'pd.DataFrame'], phone_format: str
+) -> Columns:
+    """Render dates of birth and phone numbers of a dataset as strings.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; dates of birth are stored as
+        days since 1970-01-01 (int) or datetime64 and phone numbers (if any)
+        as integers.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Returns:
+        A dict mapping names of columns (str) to their values with dates of
+        birth (YYYY-MM-DD) and phone numbers (in the chosen format) rendered
+        as strings; the dataset itself is not changed.
+    """
+    columns = dict(get_columns(dataset))
+    columns['Дата рождения'] = [
+        birthday.to_iso(day) for day in columns['Дата рождения']
+    ]
+
+    if 'Телефон' in columns:
+        columns['Телефон'] = phone.render_phone(
+            columns['Телефон'], phone_format
+        )
+
+    return columns
+
+
+def fmt_value(column: str, value: Any, phone_format: str) -> str:
+    """Render a value of a dataset as a string.
+
+    Args:
+        column: A name (str) of the column.
+        value: A value of the column.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Returns:
+        A str with the value; dates of birth and phone numbers are rendered
+        as in output files.
+    """
+    if column == 'Дата рождения':
+        return birthday.to_iso(value)
+    if column == 'Телефон':
+        return phone.fmt_phone(value, phone_format)
+
+    return str(value)
+
+
+def iter_rows(
+    columns: Columns, names: list[str], start: int = 1
+) -> Iterator[tuple[Any, ...]]:
+    """Iterate over records of a dataset.
+
+    Args:
+        columns: A dataset as columns (dict).
+        names: Names (list of str) of columns to take.
+        start: ID (int) of the first record.
+
+    Returns:
+        An iterator over tuples containing ID and values of the columns for
+        every record.
+    """
+    return zip(count(start), *(columns[name] for name in names))
+
+
+def count_rows(columns: Columns) -> int:
+    """Count records of a dataset.
+
+    Args:
+        columns: A dataset as columns (dict).
+
+    Returns:
+        An amount (int) of records.
+    """
+    return len(next(iter(columns.values())))
+
+
+def add_rows(
+    columns: Optional[Columns], chunk: Columns, limit: int
+) -> Columns:
+    """Add records of a chunk to columns keeping a limited amount of them.
+
+    Args:
+        columns: Records (dict of columns) kept before, if any.
+        chunk: A chunk of a dataset as columns (dict).
+        limit: An amount (int) of records to keep: the first ones if it is
+        positive, the last ones if it is negative.
+
+    Returns:
+        A dict of columns with the first (or the last) records of columns and
+        chunk; used for previews of datasets written in chunks.
+    """
+    if columns is None:
+        columns = {name: [] for name in chunk}
+
+    if limit > 0:
+        return {
+            name: [*values, *chunk[name][: limit - len(values)]]
+            for name, values in columns.items()
+        }
+
+    return {
+        name: [*values, *chunk[name][limit:]][limit:]
+        for name, values in columns.items()
+    }
+
+
+def gen_insert(table: str, sql_columns: list[str]) -> str:
+    """Generate a parameterized INSERT statement for SQLite3.
+
+    Args:
+        table: A name (str) of the table.
+        sql_columns: Names (list of str) of columns except ID.
+
+    Returns:
+        A str with the statement inserting ID and values of the columns.
+    """
+    names = ', '.join(['ID', *sql_columns])
+    marks = ', '.join('?' * (len(sql_columns) + 1))
+
+    return f'INSERT INTO {table} ({names}) VALUES ({marks})'
+
+
+def to_screen(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    phone_format: str,
+    total: Optional[int] = None,
+) -> str:
+    """Generate a preview of a dataset for the terminal.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        phone_format: A format (str) of phone numbers; from user input.
+        total: A total amount (int) of records if the dataset holds only the
+        first and the last MIN_ROWS // 2 of them (see add_rows()).
+
+    Returns:
+        A str with the first and the last records of the dataset (as pandas
+        displays them); only values of these records are rendered.
+    """
+    columns = get_columns(dataset)
+    names = list(columns)
+    size = count_rows(columns)
+    half = MIN_ROWS // 2
+
+    if total is None:
+        total = size
+
+    if total > MAX_ROWS:
+        shown = [(i + 1, i) for i in range(half)] + [
+            (total - half + i + 1, size - half + i) for i in range(half)
+        ]
+    else:
+        shown = [(i + 1, i) for i in range(size)]
+
+    ids = [str(record_id) for record_id, _ in shown]
+    cells = [
+        [fmt_value(name, columns[name][i], phone_format) for _, i in shown]
+        for name in names
+    ]
+
+    if total > MAX_ROWS:
+        ids.insert(half, '...')
+        for column in cells:
+            column.insert(half, '...')
+
+    id_width = max(len('ID'), *(len(i) for i in ids))
+    widths = [
+        max(len(name), *(len(cell) for cell in column))
+        for name, column in zip(names, cells)
+    ]
+
+    lines = [
+        ' ' * id_width
+        + ''.join(
+            '  ' + name.rjust(width) for name, width in zip(names, widths)
+        ),
+        'ID',
+    ]
+
+    for row, id_str in enumerate(ids):
+        lines.append(
+            id_str.ljust(id_width)
+            + ''.join(
+                '  ' + column[row].rjust(width)
+                for column, width in zip(cells, widths)
+            )
+        )
+
+    lines.append(f'\n[{total} rows x {len(names)} columns]')
+
+    return '\n'.join(lines)
+
+
+def open_writer(
+    filetype: str, output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Open a writer of a file for chunks of a dataset.
+
+    Args:
+        filetype: A type (str) of the file from WRITERS.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Returns:
+        A started generator; send() chunks of a dataset (dict of columns) to
+        it and close() it to finish the file. IDs of records continue from
+        chunk to chunk.
+    """
+    writer = WRITERS[filetype](output, path, phone_format)
+    next(writer)
+
+    return writer
+
+
+def close_writer(
+    writer: Writer, error: Optional[BaseException] = None
+) -> None:
+    """Finish the file of a writer or abort it after an error.
+
+    Args:
+        writer: A started generator from open_writer().
+        error: An exception raised while the dataset was generated, if any.
+
+    Notes:
+        The error is thrown into the writer, so the incomplete file is
+        removed instead of being finished (see remove_on_error()); errors of
+        the writer itself are raised.
+    """
+    if error is None:
+        writer.close()
+        return
+
+    try:
+        writer.throw(error)
+    except BaseException as raised:
+        if raised is not error:
+            raise
+    else:
+        writer.close()
+
+
+def close_writers(
+    writers: list[Writer], error: Optional[BaseException] = None
+) -> None:
+    """Close writers (see close_writer()), each even if others failed.
+
+    Args:
+        writers: Started generators (list) from open_writer().
+        error: An exception raised while the dataset was generated, if any.
+    """
+    with ExitStack() as stack:
+        for writer in writers:
+            stack.callback(close_writer, writer, error)
+
+
+@contextmanager
+def remove_on_error(filepath: Path) -> Iterator[None]:
+    """Remove a file written by a writer if writing is aborted.
+
+    Args:
+        filepath: A path (PosixPath) of the file.
+
+    Notes:
+        The file is kept when the writer is closed (GeneratorExit) and
+        removed on any error thrown into the writer or raised by it.
+    """
+    try:
+        yield
+    except GeneratorExit:
+        raise
+    except BaseException:
+        filepath.unlink(missing_ok=True)
+        raise
+
+
+def write_dataset(
+    writer: Writer, dataset: Union[Columns, 'pd.DataFrame']
+) -> None:
+    """Write a whole dataset with a writer.
+
+    Args:
+        writer: A generator from one of WRITERS (not started).
+        dataset: A dataset as columns (dict) or as a pandas DataFrame.
+    """
+    next(writer)
+    writer.send(get_columns(dataset))
+    writer.close()
+
+
+def print_values(table: str, value_lst: list[str], outfile: Any) -> None:
+    """Print extended INSERT statements of MySQL/MariaDB.
+
+    Args:
+        table: A name (str) of the table.
+        value_lst: Rows (list of str) rendered as tuples of SQL values.
+        outfile: A file-like object to write to.
+
+    Notes:
+        Every statement inserts up to MYSQL_ROWS rows, so statements stay
+        far below the limits of MySQL packets whatever the size of chunks.
+    """
+    for i in range(0, len(value_lst), MYSQL_ROWS):
+        print(f'INSERT INTO `{table}` VALUES', file=outfile)
+        print(
+            *value_lst[i : i + MYSQL_ROWS], sep=',\n', end=';\n', file=outfile
+        )
+
+
+def get_csv_writer(outfile: Any) -> Any:
+    """Create a CSV writer of the dialect shared by all CSV outputs.
+
+    Args:
+        outfile: A file-like object (opened with newline='') to write to.
+
+    Returns:
+        A csv writer quoting non-numeric values and ending lines with
+        os.linesep, used by csv_writer() and by the server.
+    """
+    return csv.writer(
+        outfile, quoting=csv.QUOTE_NONNUMERIC, lineterminator=os.linesep
+    )
+
+
+def csv_writer(
+    output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Write a comma-separated values (CSV) file in chunks.
 
     Args:
-        df: A dataset (pandas DataFrame) containing fake Russian
-        personal data; each record may include full name, sex, date of birth,
-        cell phone number and email address, region and populated locality.
         output: A file name without extension (str).
         path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
 
     Notes:
-        Save a pandas DataFrame as a comma-separated values (CSV) file using a
-        comma (',') to separate values.
+        Values are separated with a comma (',') and quoted; the header is
+        written with the first chunk. The file is removed if writing is
+        aborted (see close_writer()).
     """
     filename = output + '.csv'
     filepath = path.joinpath(filename)
 
-    df.to_csv(filepath, index=False, quoting=csv.QUOTE_NONNUMERIC)
+    with remove_on_error(filepath), open(
+        filepath, 'w', newline='', encoding='utf-8'
+    ) as outfile:
+        writer = get_csv_writer(outfile)
+        chunk = yield
+        writer.writerow(chunk)
 
+        while True:
+            columns = format_data(chunk, phone_format)
+            writer.writerows(zip(*columns.values()))
+
+            chunk = yield
 
-def to_excel(df: pd.DataFrame, output: str, path: Path) -> None:
-    """Generate a Microsoft Excel Spreadsheet (XLSX file).
+
+def excel_writer(
+    output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Write a Microsoft Excel Spreadsheet (XLSX file).
 
     Args:
-        df: A dataset (pandas DataFrame) containing fake Russian
-        personal data; each record may include full name, sex, date of birth,
-        cell phone number and email address, region and populated locality.
         output: A file name without extension (str).
         path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
 
     Notes:
-        Save a pandas DataFrame as a Microsoft Excel spreadsheet using XLSX file
-        format (Microsoft Excel 2007 and later).
+        Chunks are rendered as strings and kept until the writer is closed,
+        then the file is saved via pandas (up to EXCEL_MAX_ROWS records);
+        nothing is saved if writing is aborted (see close_writer()).
     """
     filename = output + '.xlsx'
     filepath = path.joinpath(filename)
+    columns: dict[str, list[str]] = {}
 
-    df.to_excel(filepath, index=False)
+    try:
+        while True:
+            chunk = yield
+            for name, values in format_data(chunk, phone_format).items():
+                columns.setdefault(name, []).extend(values)
+    except GeneratorExit:
+        import pandas as pd
 
+        pd.DataFrame(columns).to_excel(filepath, index=False)
 
-def to_sqlite3(df: pd.DataFrame, output: str, path: Path) -> None:
-    """Generate a SQLite3 file.
+
+def sqlite3_writer(
+    output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Write a SQLite3 file in chunks.
 
     Tables: 'person', 'contact' and 'location'.
 
     Args:
-        df: A dataset (pandas DataFrame) containing fake Russian
-        personal data; each record may include full name, sex, date of birth,
-        cell phone number and email address, region and populated locality.
         output: A file name without extension (str).
         path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
 
     Notes:
-        Save pandas DataFrames as a SQLIte3 database.
+        Tables are created with the first chunk, records are inserted with
+        every chunk and committed when the writer is closed. Records are
+        rolled back and the file is removed if writing is aborted (see
+        close_writer()).
     """
     filename = output + '.sqlite3'
     filepath = path.joinpath(filename)
     if filepath.is_file():
         filepath.unlink()
 
-    is_contact_info = 'Телефон' and 'E-mail' in df.columns
-    is_location_info = 'Регион' and 'Населённый пункт' in df.columns
-
-    if is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-        location = df[['Регион', 'Населённый пункт']]
-    elif is_contact_info and not is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-    elif not is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        location = df[['Регион', 'Населённый пункт']]
-    else:
-        person = df
-
-    dict_replace_person = {
-        x: y for (x, y) in zip(person.columns, SQL_PERSON_COLUMNS)
-    }
-    person = person.rename(columns=dict_replace_person)
-
-    if is_contact_info:
-        dict_replace_contact = {
-            x: y for (x, y) in zip(contact.columns, SQL_CONTACT_COLUMNS)
-        }
-        contact = contact.rename(columns=dict_replace_contact)
-    if is_location_info:
-        dict_replace_location = {
-            x: y for (x, y) in zip(location.columns, SQL_LOCATION_COLUMNS)
-        }
-        location = location.rename(columns=dict_replace_location)
-
-    con = sqlite3.connect(filepath)
-    cur = con.cursor()
-
     sql_create_person_table: str = """
     CREATE TABLE IF NOT EXISTS person
     (
@@ -143,39 +522,72 @@ def to_sqlite3(df: pd.DataFrame, output: str, path: Path) -> None:
     );
     """
 
-    cur.execute(sql_create_person_table)
+    with remove_on_error(filepath), closing(
+        sqlite3.connect(filepath)
+    ) as con:
+        cur = con.cursor()
+        chunk = yield
 
-    if is_contact_info:
-        cur.execute(sql_create_contact_table)
-    if is_location_info:
-        cur.execute(sql_create_location_table)
+        is_contact_info = 'Телефон' in chunk and 'E-mail' in chunk
+        is_location_info = 'Регион' in chunk and 'Населённый пункт' in chunk
 
-    person.to_sql('person', con, if_exists='append', index=True)
+        cur.execute(sql_create_person_table)
 
-    if is_contact_info:
-        contact.to_sql('contact', con, if_exists='append', index=True)
-    if is_location_info:
-        location.to_sql('location', con, if_exists='append', index=True)
+        if is_contact_info:
+            cur.execute(sql_create_contact_table)
+        if is_location_info:
+            cur.execute(sql_create_location_table)
 
-    con.close()
+        start = 1
 
+        while True:
+            columns = format_data(chunk, phone_format)
+
+            cur.executemany(
+                gen_insert('person', SQL_PERSON_COLUMNS),
+                iter_rows(columns, PERSON_COLUMNS, start),
+            )
+
+            if is_contact_info:
+                cur.executemany(
+                    gen_insert('contact', SQL_CONTACT_COLUMNS),
+                    iter_rows(columns, CONTACT_COLUMNS, start),
+                )
+            if is_location_info:
+                cur.executemany(
+                    gen_insert('location', SQL_LOCATION_COLUMNS),
+                    iter_rows(columns, LOCATION_COLUMNS, start),
+                )
+
+            start += count_rows(columns)
+
+            try:
+                chunk = yield
+            except GeneratorExit:
+                con.commit()
+                raise
+            except BaseException:
+                con.rollback()
+                raise
 
-def to_sql(df: pd.DataFrame, output: str, path: Path) -> None:
-    """Generate a common SQL file.
+
+def sql_writer(
+    output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Write a common SQL file in chunks.
 
     Tables: 'person', 'contact' and 'location'.
 
     Args:
-        df: A dataset (pandas DataFrame) containing fake Russian
-        personal data; each record may include full name, sex, date of birth,
-        cell phone number and email address, region and populated locality.
         output: A file name without extension (str).
         path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
 
     Notes:
-        Save pandas DataFrames as a common SQL file (may be imported into RDBMS)
-        using generic data types (INTEGER for integers, TEXT for strings, DATE
-        for dates).
+        The file (may be imported into RDBMS) uses generic data types
+        (INTEGER for integers, TEXT for strings, DATE for dates); tables are
+        created with the first chunk, every chunk is dumped into all tables.
+        The file is removed if writing is aborted (see close_writer()).
     """
     filename = output + '.sql'
     filepath = path.joinpath(filename)
@@ -210,97 +622,101 @@ def to_sql(df: pd.DataFrame, output: str, path: Path) -> None:
     );
     """
 
-    is_contact_info = 'Телефон' and 'E-mail' in df.columns
-    is_location_info = 'Регион' and 'Населённый пункт' in df.columns
+    with remove_on_error(filepath), open(filepath, 'w') as outfile:
+        chunk = yield
 
-    if is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-        location = df[['Регион', 'Населённый пункт']]
-    elif is_contact_info and not is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-    elif not is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        location = df[['Регион', 'Населённый пункт']]
-    else:
-        person = df
+        is_contact_info = 'Телефон' in chunk and 'E-mail' in chunk
+        is_location_info = 'Регион' in chunk and 'Населённый пункт' in chunk
 
-    with open(filepath, 'w') as outfile:
-        sys.stdout = outfile
-        print('-- You have to create database manually and run this file!\n\n')
-        print('BEGIN TRANSACTION;\n')
+        print(
+            '-- You have to create database manually and run this file!\n\n',
+            file=outfile,
+        )
+        print('BEGIN TRANSACTION;\n', file=outfile)
 
-        print('\n-- Create table `person`:\n')
-        print(sql_create_person_table)
+        print('\n-- Create table `person`:\n', file=outfile)
+        print(sql_create_person_table, file=outfile)
 
         if is_contact_info:
-            print('\n-- Create table `contact`:\n')
-            print(sql_create_contact_table)
-        if is_contact_info:
-            print('\n-- Create table `contact`:\n')
-            print(sql_create_location_table)
+            print('\n-- Create table `contact`:\n', file=outfile)
+            print(sql_create_contact_table, file=outfile)
+        if is_location_info:
+            print('\n-- Create table `location`:\n', file=outfile)
+            print(sql_create_location_table, file=outfile)
 
-        print('\n-- Dump data for table `person`:\n')
+        start = 1
 
-        person_lst = []
+        while True:
+            columns = format_data(chunk, phone_format)
 
-        for row in person.itertuples():
-            ID, last_name, first_name, patronymic, sex, date_of_birth = row
-            person_lst.append(
-                'INSERT INTO `person` VALUES '
-                + f'({ID}, "{last_name}", "{first_name}", "{patronymic}", '
-                + f'"{sex}", "{date_of_birth}")'
-            )
+            print('\n-- Dump data for table `person`:\n', file=outfile)
 
-        print(*person_lst, sep=';\n', end=';\n')
+            person_lst = []
 
-        if is_contact_info:
-            print('\n-- Dump data for table `contact`:\n')
+            for row in iter_rows(columns, PERSON_COLUMNS, start):
+                ID, last_name, first_name, patronymic, sex, date_of_birth = row
+                person_lst.append(
+                    'INSERT INTO `person` VALUES '
+                    + f'({ID}, "{last_name}", "{first_name}", "{patronymic}", '
+                    + f'"{sex}", "{date_of_birth}")'
+                )
 
-            contact_lst = []
+            print(*person_lst, sep=';\n', end=';\n', file=outfile)
 
-            for row in contact.itertuples():
-                ID, phone, email = row
-                contact_lst.append(
-                    'INSERT INTO `contact` VALUES '
-                    + f'({ID}, "{phone}", "{email}")'
-                )
+            if is_contact_info:
+                print('\n-- Dump data for table `contact`:\n', file=outfile)
 
-            print(*contact_lst, sep=';\n', end=';\n')
+                contact_lst = []
 
-        if is_location_info:
-            print('\n-- Dump data for table `location`:\n')
+                for row in iter_rows(columns, CONTACT_COLUMNS, start):
+                    ID, phone, email = row
+                    contact_lst.append(
+                        'INSERT INTO `contact` VALUES '
+                        + f'({ID}, "{phone}", "{email}")'
+                    )
 
-            location_lst = []
+                print(*contact_lst, sep=';\n', end=';\n', file=outfile)
 
-            for row in location.itertuples():
-                ID, region, locality = row
-                location_lst.append(
-                    'INSERT INTO `location` VALUES '
-                    + f'({ID}, "{region}", "{locality}")'
-                )
+            if is_location_info:
+                print('\n-- Dump data for table `location`:\n', file=outfile)
 
-            print(*location_lst, sep=';\n', end=';\n')
+                location_lst = []
 
-        print('\nCOMMIT;')
-        sys.stdout = STDOUT
+                for row in iter_rows(columns, LOCATION_COLUMNS, start):
+                    ID, region, locality = row
+                    location_lst.append(
+                        'INSERT INTO `location` VALUES '
+                        + f'({ID}, "{region}", "{locality}")'
+                    )
 
+                print(*location_lst, sep=';\n', end=';\n', file=outfile)
 
-def to_mysql(df: pd.DataFrame, output: str, path: Path) -> None:
-    """Generate a SQL file for MySQL/MariaDB.
+            start += count_rows(columns)
+
+            try:
+                chunk = yield
+            except GeneratorExit:
+                print('\nCOMMIT;', file=outfile)
+                raise
+
+
+def mysql_writer(
+    output: str, path: Path, phone_format: str = 'default'
+) -> Writer:
+    """Write a SQL file for MySQL/MariaDB in chunks.
 
     Tables: 'person', 'contact' and 'location'.
 
     Args:
-        df: A dataset (pandas DataFrame) containing fake Russian
-        personal data; each record may include full name, sex, date of birth,
-        cell phone number and email address, region and populated locality.
         output: A file name without extension (str).
         path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
 
     Notes:
-        Save pandas DataFrames as a SQL file to import into MySQL/MariaDB.
+        Tables are created with the first chunk, every chunk is dumped into
+        all tables with extended INSERT statements of up to MYSQL_ROWS rows
+        (see print_values()). The file is removed if writing is aborted
+        (see close_writer()).
     """
     filename = output + '.mysql'
     filepath = path.joinpath(filename)
@@ -309,7 +725,7 @@ def to_mysql(df: pd.DataFrame, output: str, path: Path) -> None:
     DROP TABLE IF EXISTS `person`;
     CREATE TABLE `person`
     (
-    `ID` SMALLINT NOT NULL,
+    `ID` INT UNSIGNED NOT NULL,
     `last_name` VARCHAR(20) NOT NULL,
     `first_name` VARCHAR(20) NOT NULL,
     `patronymic` VARCHAR(20) NOT NULL,
@@ -322,7 +738,7 @@ def to_mysql(df: pd.DataFrame, output: str, path: Path) -> None:
     DROP TABLE IF EXISTS `contact`;
     CREATE TABLE `contact`
     (
-    `ID` SMALLINT NOT NULL,
+    `ID` INT UNSIGNED NOT NULL,
     `phone` CHAR(16) NOT NULL,
     `email` VARCHAR(50) NOT NULL,
     KEY `ID` (`ID`),
@@ -334,7 +750,7 @@ def to_mysql(df: pd.DataFrame, output: str, path: Path) -> None:
     DROP TABLE IF EXISTS `location`;
     CREATE TABLE `location`
     (
-    `ID` SMALLINT NOT NULL,
+    `ID` INT UNSIGNED NOT NULL,
     `region` VARCHAR(50) NOT NULL,
     `locality` VARCHAR(50) NOT NULL,
     KEY `ID` (`ID`),
@@ -343,80 +759,213 @@ def to_mysql(df: pd.DataFrame, output: str, path: Path) -> None:
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
     """
 
-    is_contact_info = 'Телефон' and 'E-mail' in df.columns
-    is_location_info = 'Регион' and 'Населённый пункт' in df.columns
+    with remove_on_error(filepath), open(filepath, 'w') as outfile:
+        chunk = yield
 
-    if is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-        location = df[['Регион', 'Населённый пункт']]
-    elif is_contact_info and not is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        contact = df[['Телефон', 'E-mail']]
-    elif not is_contact_info and is_location_info:
-        person = df[['Фамилия', 'Имя', 'Отчество', 'Пол', 'Дата рождения']]
-        location = df[['Регион', 'Населённый пункт']]
-    else:
-        person = df
+        is_contact_info = 'Телефон' in chunk and 'E-mail' in chunk
+        is_location_info = 'Регион' in chunk and 'Населённый пункт' in chunk
 
-    with open(filepath, 'w') as outfile:
-        sys.stdout = outfile
-        print('-- Run this file in MySQL/MariaDB!\n\n')
-        print('CREATE DATABASE IF NOT EXISTS `faker_persons_ru`;\n')
-        print('USE `faker_persons_ru`;\n')
+        print('-- Run this file in MySQL/MariaDB!\n\n', file=outfile)
+        print(
+            'CREATE DATABASE IF NOT EXISTS `faker_persons_ru`;\n',
+            file=outfile,
+        )
+        print('USE `faker_persons_ru`;\n', file=outfile)
 
-        print('\n-- Create table `person`:\n')
-        print(sql_create_person_table)
+        print('\n-- Create table `person`:\n', file=outfile)
+        print(sql_create_person_table, file=outfile)
 
-        print('\n-- Dump data for table `person`:\n')
-        print('\nLOCK TABLES `person` WRITE;\n')
-        print('INSERT INTO `person` VALUES')
+        if is_contact_info:
+            print('\n-- Create table `contact`:\n', file=outfile)
+            print(sql_create_contact_table, file=outfile)
+        if is_location_info:
+            print('\n-- Create table `location`:\n', file=outfile)
+            print(sql_create_location_table, file=outfile)
 
-        person_lst = []
+        start = 1
 
-        for row in person.itertuples():
-            ID, last_name, first_name, patronymic, sex, date_of_birth = row
-            person_lst.append(
-                f'({ID}, "{last_name}", "{first_name}", "{patronymic}", '
-                + f'"{sex}", "{date_of_birth}")'
-            )
+        while True:
+            columns = format_data(chunk, phone_format)
 
-        print(*person_lst, sep=',\n', end=';\n')
-        print('\nUNLOCK TABLES;\n')
+            print('\n-- Dump data for table `person`:\n', file=outfile)
+            print('\nLOCK TABLES `person` WRITE;\n', file=outfile)
 
-        if is_contact_info:
-            print('\n-- Create table `contact`:\n')
-            print(sql_create_contact_table)
+            person_lst = []
 
-            print('\n-- Dump data for table `contact`:\n')
-            print('\nLOCK TABLES `contact` WRITE;\n')
-            print('INSERT INTO `contact` VALUES ')
+            for row in iter_rows(columns, PERSON_COLUMNS, start):
+                ID, last_name, first_name, patronymic, sex, date_of_birth = row
+                person_lst.append(
+                    f'({ID}, "{last_name}", "{first_name}", "{patronymic}", '
+                    + f'"{sex}", "{date_of_birth}")'
+                )
 
-            contact_lst = []
+            print_values('person', person_lst, outfile)
+            print('\nUNLOCK TABLES;\n', file=outfile)
 
-            for row in contact.itertuples():
-                ID, phone, email = row
-                contact_lst.append(f'({ID}, "{phone}", "{email}")')
+            if is_contact_info:
+                print('\n-- Dump data for table `contact`:\n', file=outfile)
+                print('\nLOCK TABLES `contact` WRITE;\n', file=outfile)
 
-            print(*contact_lst, sep=',\n', end=';\n')
-            print('\nUNLOCK TABLES;\n')
+                contact_lst = []
 
-        if is_location_info:
-            print('\n-- Create table `location`:\n')
-            print(sql_create_location_table)
+                for row in iter_rows(columns, CONTACT_COLUMNS, start):
+                    ID, phone, email = row
+                    contact_lst.append(f'({ID}, "{phone}", "{email}")')
+
+                print_values('contact', contact_lst, outfile)
+                print('\nUNLOCK TABLES;\n', file=outfile)
+
+            if is_location_info:
+                print('\n-- Dump data for table `location`:\n', file=outfile)
+                print('\nLOCK TABLES `location` WRITE;\n', file=outfile)
+
+                location_lst = []
+
+                for row in iter_rows(columns, LOCATION_COLUMNS, start):
+                    ID, region, locality = row
+                    location_lst.append(f'({ID}, "{region}", "{locality}")')
+
+                print_values('location', location_lst, outfile)
+                print('\nUNLOCK TABLES;\n', file=outfile)
+
+            start += count_rows(columns)
+
+            try:
+                chunk = yield
+            except GeneratorExit:
+                print('\n-- Dump completed.', file=outfile)
+                raise
 
-            print('\n-- Dump data for table `location`:\n')
-            print('\nLOCK TABLES `location` WRITE;\n')
-            print('INSERT INTO `location` VALUES ')
 
-            location_lst = []
+WRITERS: dict[str, Callable[[str, Path, str], Writer]] = {
+    'csv': csv_writer,
+    'xlsx': excel_writer,
+    'sqlite3': sqlite3_writer,
+    'sql': sql_writer,
+    'mysql': mysql_writer,
+}
 
-            for row in location.itertuples():
-                ID, region, locality = row
-                location_lst.append(f'({ID}, "{region}", "{locality}")')
 
-            print(*location_lst, sep=',\n', end=';\n')
-            print('\nUNLOCK TABLES;\n')
+def to_csv(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    output: str,
+    path: Path,
+    phone_format: str = 'default',
+) -> None:
+    """Generate a comma-separated values (CSV) file.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Notes:
+        Save a dataset as a comma-separated values (CSV) file using a comma
+        (',') to separate values; all values are quoted.
+    """
+    write_dataset(csv_writer(output, path, phone_format), dataset)
+
+
+def to_excel(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    output: str,
+    path: Path,
+    phone_format: str = 'default',
+) -> None:
+    """Generate a Microsoft Excel Spreadsheet (XLSX file).
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Notes:
+        Save a dataset as a Microsoft Excel spreadsheet using XLSX file
+        format (Microsoft Excel 2007 and later) via pandas.
+    """
+    write_dataset(excel_writer(output, path, phone_format), dataset)
+
+
+def to_sqlite3(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    output: str,
+    path: Path,
+    phone_format: str = 'default',
+) -> None:
+    """Generate a SQLite3 file.
 
-        print('\n-- Dump completed.')
-        sys.stdout = STDOUT
+    Tables: 'person', 'contact' and 'location'.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Notes:
+        Save a dataset as a SQLite3 database.
+    """
+    write_dataset(sqlite3_writer(output, path, phone_format), dataset)
+
+
+def to_sql(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    output: str,
+    path: Path,
+    phone_format: str = 'default',
+) -> None:
+    """Generate a common SQL file.
+
+    Tables: 'person', 'contact' and 'location'.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Notes:
+        Save a dataset as a common SQL file (may be imported into RDBMS)
+        using generic data types (INTEGER for integers, TEXT for strings, DATE
+        for dates).
+    """
+    write_dataset(sql_writer(output, path, phone_format), dataset)
+
+
+def to_mysql(
+    dataset: Union[Columns, 'pd.DataFrame'],
+    output: str,
+    path: Path,
+    phone_format: str = 'default',
+) -> None:
+    """Generate a SQL file for MySQL/MariaDB.
+
+    Tables: 'person', 'contact' and 'location'.
+
+    Args:
+        dataset: A dataset as columns (dict) or as a pandas DataFrame
+        containing fake Russian personal data; each record may include full
+        name, sex, date of birth, cell phone number and email address, region
+        and populated locality.
+        output: A file name without extension (str).
+        path: A path (PosixPath) to user's home directory.
+        phone_format: A format (str) of phone numbers; from user input.
+
+    Notes:
+        Save a dataset as a SQL file to import into MySQL/MariaDB.
+    """
+    write_dataset(mysql_writer(output, path, phone_format), dataset)
@@ -0,0 +1,110 @@
+"""Module for keyed bijective permutations of integer ranges."""
+import random
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ROUNDS: int = 4
+MASK_64: int = 0xFFFFFFFFFFFFFFFF
+
+
+class Permutation:
+    """A keyed pseudo-random permutation of range(size).
+
+    A balanced Feistel network over the smallest even number of bits covering
+    the range; values falling outside of the range are encrypted again (cycle
+    walking), so every index maps to a unique value of the same range. Only
+    the round keys are stored, whatever the size of the range.
+    """
+
+    def __init__(self, size: int, key: int) -> None:
+        """Prepare round keys for a permutation.
+
+        Args:
+            size: A size (int) of the permuted range.
+            key: A key (int) selecting one of the permutations.
+        """
+        if size < 1:
+            raise ValueError('The size of a permutation must be positive.')
+
+        half_bits = max((size - 1).bit_length() + 1, 2) // 2
+        rng = random.Random(key)
+
+        self.size = size
+        self.half_bits = half_bits
+        self.half_mask = (1 << half_bits) - 1
+        self.keys = [rng.getrandbits(64) for _ in range(ROUNDS)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        """Get a value of the permutation for the index.
+
+        Args:
+            index: A position (int) in range(size).
+
+        Returns:
+            A value (int) from range(size); different indexes always get
+            different values.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError('Permutation index out of range.')
+
+        value = self._encrypt(index)
+
+        while value >= self.size:
+            value = self._encrypt(value)
+
+        return value
+
+    def take(self, indexes: 'np.ndarray') -> 'np.ndarray':
+        """Get values of the permutation for an array of indexes at once.
+
+        Args:
+            indexes: An array (numpy, of int) of positions in range(size).
+
+        Returns:
+            An array (numpy, of uint64) with the same values as the ones from
+            indexing the permutation by each position.
+        """
+        import numpy as np
+
+        values = self._encrypt_array(indexes.astype(np.uint64))
+        outside = np.flatnonzero(values >= self.size)
+
+        while outside.size:
+            values[outside] = self._encrypt_array(values[outside])
+            outside = outside[values[outside] >= self.size]
+
+        return values
+
+    def _encrypt(self, value: int) -> int:
+        half_bits = self.half_bits
+        half_mask = self.half_mask
+        left = value >> half_bits
+        right = value & half_mask
+
+        for key in self.keys:
+            mixed = ((right ^ key) * 0x9E3779B97F4A7C15) & MASK_64
+            mixed ^= mixed >> 31
+            left, right = right, left ^ (mixed & half_mask)
+
+        return (left << half_bits) | right
+
+    def _encrypt_array(self, values: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+
+        half_bits = np.uint64(self.half_bits)
+        half_mask = np.uint64(self.half_mask)
+        left = values >> half_bits
+        right = values & half_mask
+
+        for key in self.keys:
+            mixed = (right ^ np.uint64(key)) * np.uint64(0x9E3779B97F4A7C15)
+            mixed ^= mixed >> np.uint64(31)
+            left, right = right, left ^ (mixed & half_mask)
+
+        return (left << half_bits) | right
@@ -1,6 +1,12 @@
 """Module for generating fake Russian cell phone numbers."""
 import random
 
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from faker_persons_ru import BATCH_SIZE
+from faker_persons_ru.modules.permutation import Permutation
+
 CODES: list[str] = [
     '907',
     '935',
@@ -16,26 +22,192 @@ CODES: list[str] = [
     '975',
     '976',
 ]
+NUMBERS: range = range(1110011, 9990100)
+CAPACITY: int = len(CODES) * len(NUMBERS)
+CODES_INT: list[int] = [int(code) for code in CODES]
+SPACES: int = 64
+PART_WIDTHS: tuple[int, int, int] = (3, 3, 4)
+PHONE_FORMATS: dict[str, tuple[bytes, tuple[int, ...]]] = {
+    'default': (b'+7(000)000-00-00', (3, 4, 5, 7, 8, 9, 11, 12, 14, 15)),
+    'e164': (b'+70000000000', (2, 3, 4, 5, 6, 7, 8, 9, 10, 11)),
+    'digits': (b'70000000000', (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)),
+}
 
 
-def gen_phone(total: int) -> list[str]:
+def gen_phone(
+    total: int, start: int = 0, key: Optional[int] = None
+) -> list[int]:
     """Generate a dataset of fake Russian cell phone numbers.
 
     Args:
         total: A total amount (int) of records/fake persons; from user input.
+        start: A position (int) of the first phone in the permutation; chunks
+        of one dataset take consecutive positions.
+        key: A key (int) of the permutation; shared by chunks of one dataset
+        (a random one if not passed).
+
+    Returns:
+        A list (of int) representing fake Russian cell phone numbers as
+        10-digit integers (code * 10^7 + number).
+
+    Notes:
+        Phones are unique as pairs of code and number: positions in the space
+        of all codes and numbers (about 115M phones) are taken from a random
+        permutation of this space, so nothing but the permutation key is kept
+        to guarantee uniqueness. Phones are rendered as strings only for
+        output (see render_phone()). Batches of BATCH_SIZE phones and more
+        are computed with numpy, smaller ones (e.g. a quick CLI run) without
+        importing it.
+    """
+    if start + total > CAPACITY:
+        raise ValueError(
+            f'Unable to generate {start + total} unique phones, '
+            + f'only {CAPACITY} phone numbers are available.'
+        )
+
+    if key is None:
+        key = random.getrandbits(64)
+
+    phone_space = get_phone_space(key)
+
+    if total < BATCH_SIZE:
+        return [to_phone(phone_space[i]) for i in range(start, start + total)]
+
+    import numpy as np
+
+    positions = phone_space.take(np.arange(start, start + total))
+    code_idx, num_idx = np.divmod(positions, len(NUMBERS))
+
+    phone_arr = np.array(CODES_INT, dtype=np.int64)[code_idx] * 10**7 + (
+        num_idx.astype(np.int64) + NUMBERS.start
+    )
+
+    return phone_arr.tolist()
+
+
+@lru_cache(maxsize=SPACES)
+def get_phone_space(key: int) -> Permutation:
+    """Get the permutation of all phones for a key (cached).
+
+    Args:
+        key: A key (int) of the permutation of a dataset.
+
+    Returns:
+        An object of class 'Permutation' of range(CAPACITY); the last SPACES
+        permutations are cached, so chunks of a dataset do not prepare round
+        keys again.
+    """
+    return Permutation(CAPACITY, key)
+
+
+def to_phone(position: int) -> int:
+    """Get a phone number by its position in the space of all phones.
+
+    Args:
+        position: A position (int) in range(CAPACITY).
+
+    Returns:
+        A 10-digit phone number (int).
+    """
+    code_idx, num_idx = divmod(position, len(NUMBERS))
+
+    return CODES_INT[code_idx] * 10**7 + NUMBERS[num_idx]
+
+
+def render_phone(phones: Sequence[int], phone_format: str) -> list[str]:
+    """Render fake Russian cell phone numbers as strings.
+
+    Args:
+        phones: A sequence (list or numpy array, of int) of 10-digit phone
+        numbers.
+        phone_format: A format (str) from PHONE_FORMATS: "default"
+        ('+7(XXX)XXX-XX-XX'), "e164" ('+7XXXXXXXXXX') or "digits"
+        ('7XXXXXXXXXX').
 
     Returns:
         A list of str representing fake Russian cell phone numbers.
+
+    Notes:
+        For batches of BATCH_SIZE phones and more every phone is put
+        together from three rendered parts (see get_phone_parts()) gathered
+        by numpy into one buffer of fixed-width records separated by line
+        feeds; the buffer is decoded once and split into strings, so no
+        digit is computed or sliced in Python.
     """
-    phone_lst: list[str] = []
-    phone_num_dset = [num for num in range(1110011, 9990100)]
-    random.shuffle(phone_num_dset)
+    if len(phones) < BATCH_SIZE:
+        return [fmt_phone(number, phone_format) for number in phones]
+
+    import numpy as np
 
-    for _ in range(total):
-        num = str(phone_num_dset.pop())
-        code = random.choice(CODES)
-        phone = f'+7({code}){str(num)[:3]}-{str(num)[3:5]}-{str(num)[5:]}'
+    heads, middles, tails = get_phone_parts(phone_format)
+    values = np.asarray(phones, dtype=np.int64)
+    buffer = np.empty(
+        len(values),
+        dtype=[
+            ('head', heads.dtype),
+            ('middle', middles.dtype),
+            ('tail', tails.dtype),
+            ('end', 'S1'),
+        ],
+    )
+    buffer['head'] = heads[values // 10**7]
+    buffer['middle'] = middles[values // 10**4 % 1000]
+    buffer['tail'] = tails[values % 10**4]
+    buffer['end'] = b'\n'
+
+    return buffer.tobytes()[:-1].decode('ascii').split('\n')
+
+
+@lru_cache(maxsize=None)
+def get_phone_parts(phone_format: str) -> tuple[Any, Any, Any]:
+    """Render all parts of phones in a format (cached).
+
+    Args:
+        phone_format: A format (str) from PHONE_FORMATS.
+
+    Returns:
+        A tuple of arrays (numpy, of fixed-width bytes) of the rendered
+        parts of a phone: everything up to the fourth digit for every code
+        (000-999), everything up to the seventh digit for every next three
+        digits (000-999) and the rest for every last four digits
+        (0000-9999); a phone is the concatenation of its three parts.
+    """
+    import numpy as np
+
+    template, positions = PHONE_FORMATS[phone_format]
+    bounds = (0, positions[3], positions[6], len(template))
+    parts: list[Any] = []
+    first = 0
+
+    for width, lower, upper in zip(PART_WIDTHS, bounds, bounds[1:]):
+        part_lst: list[bytes] = []
+
+        for value in range(10**width):
+            chars = bytearray(template)
+            for pos, digit in zip(positions[first:], f'{value:0{width}d}'):
+                chars[pos] = ord(digit)
+            part_lst.append(bytes(chars[lower:upper]))
+
+        parts.append(np.array(part_lst, dtype=f'S{upper - lower}'))
+        first += width
+
+    return parts[0], parts[1], parts[2]
+
+
+def fmt_phone(phone: int, phone_format: str) -> str:
+    """Render a fake Russian cell phone number as a string.
+
+    Args:
+        phone: A 10-digit phone number (int).
+        phone_format: A format (str) from PHONE_FORMATS.
+
+    Returns:
+        A str representing a fake Russian cell phone number.
+    """
+    template, positions = PHONE_FORMATS[phone_format]
+    chars = list(template.decode('ascii'))
 
-        phone_lst.append(phone)
+    for pos, digit in zip(positions, str(phone)):
+        chars[pos] = digit
 
-    return phone_lst
+    return ''.join(chars)
@@ -0,0 +1,80 @@
+"""Module for seeding independent streams of random numbers."""
+import hashlib
+import random
+
+from typing import NamedTuple, Optional, Union
+
+
+class Streams(NamedTuple):
+    """Streams of random numbers for subsystems of a shard of a dataset."""
+
+    names: random.Random
+    birthdays: random.Random
+    emails: random.Random
+    locations: random.Random
+    records: random.Random
+
+
+def gen_seed(seed: Optional[int] = None) -> int:
+    """Get a seed of a dataset.
+
+    Args:
+        seed: A seed (int) from user input or None.
+
+    Returns:
+        The seed (int) or--if it was not passed--a new 64-bit seed drawn
+        from the global random generator (so random.seed() still makes runs
+        reproducible).
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    return seed
+
+
+def get_key(seed: int, *labels: Union[str, int]) -> bytes:
+    """Derive a key for a subsystem of a dataset.
+
+    Args:
+        seed: A seed (int) of the dataset.
+        labels: Names of a subsystem and numbers of a shard (str or int).
+
+    Returns:
+        A 128-bit hash (bytes, BLAKE2b) of the seed and the labels.
+    """
+    key = ':'.join(str(label) for label in (seed, *labels))
+
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+
+def get_rng(seed: int, *labels: Union[str, int]) -> random.Random:
+    """Create a stream of random numbers for a subsystem of a dataset.
+
+    Args:
+        seed: A seed (int) of the dataset.
+        labels: Names of a subsystem and numbers of a shard (str or int)
+        selecting the stream.
+
+    Returns:
+        An object of class 'random.Random' seeded with the key of the labels
+        (see get_key()); streams of different labels are independent and do
+        not depend on the order they are created in.
+    """
+    return random.Random(int.from_bytes(get_key(seed, *labels), 'little'))
+
+
+def gen_streams(seed: int, shard: int) -> Streams:
+    """Create streams of random numbers for subsystems of a shard.
+
+    Args:
+        seed: A seed (int) of a dataset.
+        shard: A number (int) of a shard of the dataset.
+
+    Returns:
+        An object of namedtuple 'Streams' with one stream for each subsystem:
+        names, birthdays (with collisions), emails, locations and records
+        (splitting blocks and shuffling them).
+    """
+    return Streams(
+        *(get_rng(seed, subsystem, shard) for subsystem in Streams._fields)
+    )
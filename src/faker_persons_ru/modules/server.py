@@ -0,0 +1,393 @@
+"""
+Module for serving generated datasets over HTTP (asyncio, no dependencies).
+
+A request `GET /persons?total=&data=&seed=&format=&phone_format=` streams a
+dataset from datasets.iter_persons() as NDJSON (one JSON object per record)
+or CSV with chunked transfer encoding. Chunks are generated and rendered by
+a pool of threads, so the event loop keeps serving other clients while a
+dataset is generated; reference data and samplers are loaded once, before
+the server starts accepting requests (see warm_up()).
+"""
+import asyncio
+import io
+import json
+import logging
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from faker_persons_ru import BATCH_SIZE
+from faker_persons_ru.modules import datasets
+from faker_persons_ru.modules import outputs
+from faker_persons_ru.modules import phone
+
+HOST: str = '127.0.0.1'
+PORT: int = 8000
+THREADS: int = 4
+CHUNK_SIZE: int = BATCH_SIZE
+MAX_HEADERS: int = 100
+DATA_TYPES: tuple[str, ...] = ('base', 'contact', 'location', 'full')
+CONTENT_TYPES: dict[str, str] = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+REASONS: dict[int, str] = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+}
+
+logger = logging.getLogger(__name__)
+
+
+class RequestError(ValueError):
+    """An error raised when a request can not be served."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def parse_query(target: str) -> dict[str, Any]:
+    """Parse parameters of a request for a dataset.
+
+    Args:
+        target: A target (str) of the request line, e.g.
+        '/persons?total=100&data=full&seed=1&format=csv'.
+
+    Returns:
+        A dict with the total (int), data (str), seed (int or None), format
+        (str) and phone_format (str) of the dataset.
+
+    Raises:
+        RequestError: The path is unknown or a parameter is invalid.
+    """
+    url = urlsplit(target)
+
+    if url.path not in ('/', '/persons'):
+        raise RequestError(404, f'Unknown path "{url.path}".')
+
+    query = {
+        name: values[-1]
+        for name, values in parse_qs(url.query, keep_blank_values=True).items()
+    }
+    params: dict[str, Any] = {
+        'data': query.get('data', 'base').lower(),
+        'format': query.get('format', 'ndjson').lower(),
+        'phone_format': query.get('phone_format', 'default').lower(),
+    }
+
+    try:
+        params['total'] = int(query.get('total', '1000'))
+        params['seed'] = int(query['seed']) if query.get('seed') else None
+    except ValueError:
+        raise RequestError(400, 'Total and seed must be integers.') from None
+
+    if params['total'] < 1:
+        raise RequestError(400, 'Total must be positive.')
+    if params['data'] not in DATA_TYPES:
+        raise RequestError(
+            400, f'Data must be one of {", ".join(DATA_TYPES)}.'
+        )
+    if params['format'] not in CONTENT_TYPES:
+        raise RequestError(400, 'Format must be "ndjson" or "csv".')
+    if params['phone_format'] not in phone.PHONE_FORMATS:
+        raise RequestError(
+            400,
+            f'Phone format must be one of {", ".join(phone.PHONE_FORMATS)}.',
+        )
+    if (
+        params['data'] in ('contact', 'full')
+        and params['total'] > phone.CAPACITY
+    ):
+        raise RequestError(
+            400, f'Only {phone.CAPACITY} unique phone numbers are available.'
+        )
+
+    return params
+
+
+def render_ndjson(
+    columns: outputs.Columns, phone_format: str, start: int
+) -> bytes:
+    """Render a chunk of a dataset as NDJSON.
+
+    Args:
+        columns: A chunk of a dataset as columns (dict).
+        phone_format: A format (str) of phone numbers.
+        start: ID (int) of the first record of the chunk.
+
+    Returns:
+        Bytes (UTF-8) with one JSON object per line for every record: ID and
+        values of the columns, dates and phones rendered as in output files.
+    """
+    columns = outputs.format_data(columns, phone_format)
+    names = ['ID', *columns]
+    lines = [
+        json.dumps(dict(zip(names, row)), ensure_ascii=False)
+        for row in outputs.iter_rows(columns, list(columns), start)
+    ]
+
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def render_csv(
+    columns: outputs.Columns, phone_format: str, start: int
+) -> bytes:
+    """Render a chunk of a dataset as CSV.
+
+    Args:
+        columns: A chunk of a dataset as columns (dict).
+        phone_format: A format (str) of phone numbers.
+        start: ID (int) of the first record of the chunk; the header is
+        written before the first record of the dataset.
+
+    Returns:
+        Bytes (UTF-8) with quoted values separated with a comma, in the same
+        dialect as CSV files of outputs.csv_writer() (see
+        outputs.get_csv_writer()).
+    """
+    buffer = io.StringIO(newline='')
+    writer = outputs.get_csv_writer(buffer)
+
+    if start == 1:
+        writer.writerow(columns)
+
+    columns = outputs.format_data(columns, phone_format)
+    writer.writerows(zip(*columns.values()))
+
+    return buffer.getvalue().encode('utf-8')
+
+
+RENDERERS = {'ndjson': render_ndjson, 'csv': render_csv}
+
+
+def render_next(
+    chunks: Iterator[dict[str, list[Any]]],
+    fmt: str,
+    phone_format: str,
+    start: int,
+) -> Optional[tuple[bytes, int]]:
+    """Generate and render the next chunk of a dataset (run in a thread).
+
+    Args:
+        chunks: An iterator over chunks from datasets.iter_persons().
+        fmt: A format (str) from CONTENT_TYPES.
+        phone_format: A format (str) of phone numbers.
+        start: ID (int) of the first record of the chunk.
+
+    Returns:
+        A tuple of rendered bytes and the amount (int) of records of the
+        chunk or None if the dataset is exhausted.
+    """
+    columns = next(chunks, None)
+
+    if columns is None:
+        return None
+
+    body = RENDERERS[fmt](columns, phone_format, start)
+
+    return body, outputs.count_rows(columns)
+
+
+def warm_up() -> None:
+    """Load reference data, samplers and numpy before serving requests.
+
+    Notes:
+        Tables of names and localities, alias samplers and tables of dates
+        of birth are cached by their modules, so one small "full" dataset
+        prepares them for all requests of the server.
+    """
+    for columns in datasets.iter_persons(CHUNK_SIZE, 'full', seed=0):
+        render_ndjson(columns, 'default', 1)
+
+
+def gen_head(status: int, headers: dict[str, str]) -> bytes:
+    """Generate a status line and headers of a response.
+
+    Args:
+        status: A status code (int) from REASONS.
+        headers: Headers (dict) of the response.
+
+    Returns:
+        Bytes with the status line and the headers ending with a blank line.
+    """
+    lines = [f'HTTP/1.1 {status} {REASONS[status]}']
+    lines += [f'{name}: {value}' for name, value in headers.items()]
+
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+async def send_error(
+    writer: asyncio.StreamWriter, error: RequestError
+) -> None:
+    """Send an error as a plain text response.
+
+    Args:
+        writer: A stream (asyncio.StreamWriter) of the client.
+        error: An object of class 'RequestError'.
+    """
+    body = (str(error) + '\n').encode('utf-8')
+    writer.write(
+        gen_head(
+            error.status,
+            {
+                'Content-Type': 'text/plain; charset=utf-8',
+                'Content-Length': str(len(body)),
+                'Connection': 'close',
+            },
+        )
+        + body
+    )
+    await writer.drain()
+
+
+async def read_request(reader: asyncio.StreamReader) -> str:
+    """Read a request line and skip headers of a request.
+
+    Args:
+        reader: A stream (asyncio.StreamReader) of the client.
+
+    Returns:
+        A target (str) of the request.
+
+    Raises:
+        RequestError: The request is malformed or its method is not GET.
+    """
+    request_line = (await reader.readline()).decode('latin-1').split()
+
+    if len(request_line) != 3:
+        raise RequestError(400, 'Malformed request line.')
+
+    method, target, _ = request_line
+
+    for _ in range(MAX_HEADERS):
+        if (await reader.readline()).strip() == b'':
+            break
+    else:
+        raise RequestError(400, 'Too many headers.')
+
+    if method != 'GET':
+        raise RequestError(405, 'Only GET requests are served.')
+
+    return target
+
+
+async def handle_client(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    executor: Executor,
+) -> None:
+    """Serve one request of a client.
+
+    Args:
+        reader: A stream (asyncio.StreamReader) of the client.
+        writer: A stream (asyncio.StreamWriter) of the client.
+        executor: A pool of threads generating chunks.
+
+    Notes:
+        Every chunk is generated in the pool and written before the next one
+        is generated, so a slow client slows down only its own dataset; the
+        dataset is dropped if the client disconnects. The first chunk is
+        generated before the response starts, so datasets beyond the
+        capacity of dates of birth (see datasets.check_capacity()) get an
+        error response; if generation fails later, the error is logged and
+        the connection is closed without the last (empty) chunk.
+    """
+    loop = asyncio.get_running_loop()
+
+    try:
+        params = parse_query(await read_request(reader))
+    except RequestError as error:
+        await send_error(writer, error)
+        writer.close()
+        return
+
+    chunks = datasets.iter_persons(
+        params['total'], params['data'], CHUNK_SIZE, seed=params['seed']
+    )
+    step = partial(
+        render_next, chunks, params['format'], params['phone_format']
+    )
+    start = 1
+
+    try:
+        rendered = await loop.run_in_executor(executor, step, start)
+    except datasets.UniquenessError as error:
+        await send_error(writer, RequestError(400, str(error)))
+        writer.close()
+        return
+
+    try:
+        writer.write(
+            gen_head(
+                200,
+                {
+                    'Content-Type': CONTENT_TYPES[params['format']],
+                    'Transfer-Encoding': 'chunked',
+                    'Connection': 'close',
+                },
+            )
+        )
+
+        while rendered is not None:
+            body, size = rendered
+            writer.write(b'%x\r\n%b\r\n' % (len(body), body))
+            await writer.drain()
+            start += size
+            rendered = await loop.run_in_executor(executor, step, start)
+
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+    except ConnectionError:
+        logger.info('Client disconnected after %d records.', start - 1)
+    except Exception:
+        # The terminating chunk is not sent, so the client sees a truncated
+        # response instead of a complete dataset.
+        logger.exception('Generation failed after %d records.', start - 1)
+    finally:
+        writer.close()
+
+
+async def run_server(
+    host: str = HOST,
+    port: int = PORT,
+    socket_path: Optional[str] = None,
+    threads: int = THREADS,
+) -> None:
+    """Serve datasets until the task is cancelled.
+
+    Args:
+        host: A host (str) to listen on; localhost by default.
+        port: A port (int) to listen on.
+        socket_path: A path (str) of a Unix socket to listen on instead of
+        the host and port.
+        threads: An amount (int) of threads generating datasets.
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        await asyncio.get_running_loop().run_in_executor(executor, warm_up)
+        handler = partial(handle_client, executor=executor)
+
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(handler, socket_path)
+        else:
+            server = await asyncio.start_server(handler, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+
+def serve(
+    host: str = HOST,
+    port: int = PORT,
+    socket_path: Optional[str] = None,
+    threads: int = THREADS,
+) -> None:
+    """Run the server (see run_server()) until it is interrupted."""
+    try:
+        asyncio.run(run_server(host, port, socket_path, threads))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,55 @@
+"""Tests for module datasets."""
+import random
+
+import pytest
+
+from faker_persons_ru.modules.datasets import Collisions, UniquenessError
+
+
+@pytest.mark.parametrize('capacity', [1, 2, 10, 101])
+def test_resolve_fills_all_dates_of_a_name(capacity):
+    collisions = Collisions(range(capacity), rng=random.Random(0))
+    dates = {collisions.resolve((0, 0, 0), 0) for _ in range(capacity)}
+
+    assert dates == set(range(capacity))
+
+    with pytest.raises(UniquenessError):
+        collisions.resolve((0, 0, 0), 0)
+
+
+def test_resolve_all_fills_all_dates_of_a_name():
+    collisions = Collisions(range(10), rng=random.Random(0))
+    dates = collisions.resolve_all([(0, 0, 0)] * 10, [0] * 10)
+
+    assert sorted(dates) == list(range(10))
+
+    with pytest.raises(UniquenessError):
+        collisions.resolve((0, 0, 0), 0)
+
+
+def test_resolve_all_redraws_names_without_free_dates():
+    collisions = Collisions(range(2), rng=random.Random(0))
+    names = [(0, 0, 0)] * 4
+    new_names = iter([(0, 0, 0), (1, 0, 0), (1, 0, 0)])
+    dates = collisions.resolve_all(names, [0] * 4, lambda: next(new_names))
+
+    assert collisions.redrawn == 3
+    assert names == [(0, 0, 0), (0, 0, 0), (1, 0, 0), (1, 0, 0)]
+    assert len(set(zip(names, dates))) == 4
+
+
+def test_resolve_checks_flushed_keys():
+    collisions = Collisions(range(10), rng=random.Random(0))
+    dates = set()
+
+    for _ in range(10):
+        dates.add(collisions.resolve((0, 0, 0), 0))
+        collisions.person_keys.flush(1)
+
+    assert dates == set(range(10))
+    assert collisions.person_keys.find_one(
+        collisions.person_keys.runs[0][0].item()
+    ) == (True, 10)
+
+    with pytest.raises(UniquenessError):
+        collisions.resolve((0, 0, 0), 0)